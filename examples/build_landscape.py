@@ -7,9 +7,9 @@ from visual_callbacks import ExploreLandscape, VisualTracker
 pool = peal.genetics.NumberPool(shape=2, lower=-5, upper=5)
 
 
-@peal.fitness
-def evaluate(individual: peal.Individual) -> float:
-    x, y = individual.genes
+@peal.fitness(batched=True)
+def evaluate(genes: np.ndarray) -> np.ndarray:
+    x, y = genes.T
     return - (x**2 + y - 11)**2 - (x + y**2 - 7)**2
 
 
@@ -1,5 +1,6 @@
+import sys
+
 import numpy as np
-import matplotlib.pyplot as plt
 
 import peal
 
@@ -53,7 +54,11 @@ strategy = peal.core.Strategy(
 
 environment = peal.core.Environment(
     pool=pool,
-    fitness=peal.GPFitness(arguments=args, evaluation=evaluate),
+    fitness=peal.GPFitness(
+        arguments=args,
+        evaluation=evaluate,
+        vectorized=True,
+    ),
 )
 
 tracker = peal.callback.BestWorst()
@@ -62,16 +67,21 @@ environment.execute(strategy, callbacks=[tracker])
 
 print(tracker.best[-1])
 
-fig = plt.figure(figsize=(10, 5))
 
-axis1 = fig.add_subplot(1, 2, 1)
-axis1.plot(tracker.best.fitness, color="blue")
-axis1.set_title("Fitness/Diversity")
-axis2 = fig.add_subplot(1, 2, 2)
-axis2.plot(X, np.exp(-X**2))
-axis2.plot(
-    X,
-    [peal.evaluation.gp_evaluate(tracker.best[-1], argset) for argset in args]
-)
+def plot(tracker: peal.callback.BestWorst) -> None:
+    import matplotlib.pyplot as plt
+
+    fig = plt.figure(figsize=(10, 5))
+
+    axis1 = fig.add_subplot(1, 2, 1)
+    axis1.plot(tracker.best.fitness, color="blue")
+    axis1.set_title("Fitness/Diversity")
+    axis2 = fig.add_subplot(1, 2, 2)
+    axis2.plot(X, np.exp(-X**2))
+    axis2.plot(X, peal.evaluation.gp_evaluate_batch(tracker.best[-1], args))
+
+    plt.show()
+
 
-plt.show()
+if __name__ == "__main__" and "--no-plot" not in sys.argv:
+    plot(tracker)
@@ -1,4 +1,5 @@
-import matplotlib.pyplot as plt
+import sys
+
 import numpy as np
 
 import peal
@@ -8,11 +9,7 @@ A = np.array([4, 74, 43, 23, 0])
 pool = peal.genetics.NumberPool(shape=A.size, lower=0, upper=101)
 
 
-@peal.fitness
-def evaluate(individual: peal.Individual) -> float:
-    """Negative MSE comparing individuals genes to A."""
-    return - np.mean((A - individual.genes)**2)
-
+evaluate = peal.evaluation.negative_mse(A)
 
 strategy = peal.core.Strategy.from_string(
     "1/1,2(2/1,10)^10",
@@ -30,23 +27,35 @@ environment.execute(strategy, callbacks=[tracker, statistics])
 
 print(tracker.best)
 
-# - plotting -
 
-fig = plt.figure(figsize=(10, 8))
+def plot(
+    tracker: peal.callback.BestWorst,
+    statistics: peal.callback.Diversity,
+) -> None:
+    import matplotlib.pyplot as plt
+
+    fig = plt.figure(figsize=(10, 8))
+
+    axis1 = fig.add_subplot(3, 1, 1)
+    axis1.plot(tracker.best.fitness, label="best (normal)")
+    axis1.set_title("Fitness")
+    axis1.legend(loc="best")
+
+    axis2 = fig.add_subplot(3, 1, 2)
+    axis2.plot(statistics.diversity, label="normal")
+    axis2.set_title("Diversity")
+    axis2.legend(loc="best")
 
-axis1 = fig.add_subplot(3, 1, 1)
-axis1.plot(tracker.best.fitness, label="best (normal)")
-axis1.set_title("Fitness")
-axis1.legend(loc="best")
+    axis3 = fig.add_subplot(3, 1, 3)
+    axis3.plot(
+        [indiv.hidden_genes[0] for indiv in tracker.best],
+        label="normal",
+    )
+    axis3.set_title("Mutation step size")
+    axis3.legend(loc="best")
 
-axis2 = fig.add_subplot(3, 1, 2)
-axis2.plot(statistics.diversity, label="normal")
-axis2.set_title("Diversity")
-axis2.legend(loc="best")
+    plt.show()
 
-axis3 = fig.add_subplot(3, 1, 3)
-axis3.plot([indiv.hidden_genes[0] for indiv in tracker.best], label="normal")
-axis3.set_title("Mutation step size")
-axis3.legend(loc="best")
 
-plt.show()
+if __name__ == "__main__" and "--no-plot" not in sys.argv:
+    plot(tracker, statistics)
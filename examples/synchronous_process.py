@@ -1,17 +1,23 @@
-import matplotlib.pyplot as plt
+import sys
+
 import numpy as np
 
 import peal
 
 A = np.array([4, 74, 43, 23, 0])
 
-pool = peal.genetics.IntegerPool(shape=A.size, lower=0, upper=101)
+pool = peal.genetics.IntegerPool(
+    shape=A.size,
+    lower=0,
+    upper=101,
+    dtype=np.uint8,
+)
 
 
-@peal.fitness
-def evaluate(individual: peal.Individual) -> float:
-    """Negative MSE comparing individuals genes to A."""
-    return -np.mean((A - individual.genes)**2)
+@peal.fitness(batched=True)
+def evaluate(genes: np.ndarray) -> np.ndarray:
+    """Negative MSE comparing the genes of all individuals to A."""
+    return -np.mean((A - genes)**2, axis=1)
 
 
 strategy = peal.core.Strategy(
@@ -42,16 +48,25 @@ environment.execute(strategy, callbacks=[tracker, statistics])
 
 print(tracker.best)
 
-# - plotting -
 
-fig = plt.figure(figsize=(10, 5))
+def plot(
+    tracker: peal.callback.BestWorst,
+    statistics: peal.callback.Diversity,
+) -> None:
+    import matplotlib.pyplot as plt
+
+    fig = plt.figure(figsize=(10, 5))
+
+    axis1 = fig.add_subplot(2, 1, 1)
+    axis1.plot(tracker.best.fitness)
+    axis1.set_title("Fitness")
+
+    axis2 = fig.add_subplot(2, 1, 2)
+    axis2.plot(statistics.diversity)
+    axis2.set_title("Diversity")
 
-axis1 = fig.add_subplot(2, 1, 1)
-axis1.plot(tracker.best.fitness)
-axis1.set_title("Fitness")
+    plt.show()
 
-axis2 = fig.add_subplot(2, 1, 2)
-axis2.plot(statistics.diversity)
-axis2.set_title("Diversity")
 
-plt.show()
+if __name__ == "__main__" and "--no-plot" not in sys.argv:
+    plot(tracker, statistics)
@@ -2,11 +2,97 @@ import time
 from typing import Literal, Optional
 
 import matplotlib.pyplot as plt
+from matplotlib.artist import Artist
+from matplotlib.transforms import Bbox
 import numpy as np
 
 import peal
 
 
+def _grow_limits(
+    limits: tuple[float, float],
+    low: float,
+    high: float,
+) -> tuple[float, float]:
+    # extends the limits to include [low, high] with a margin of 10% of
+    # the new range, so a changing value does not force a full redraw
+    # of the figure in each generation
+    lower, upper = min(limits[0], low), max(limits[1], high)
+    margin = 0.1 * (upper - lower)
+    if lower < limits[0]:
+        lower -= margin
+    if upper > limits[1]:
+        upper += margin
+    return lower, upper
+
+
+class _Blitter:
+    """Redraws a number of animated artists of an axis by restoring a
+    saved background and blitting only the axis region, instead of
+    rendering the whole figure each time. The background is captured
+    again after every full draw of the figure, e.g. after resizing.
+
+    Args:
+        fig (plt.Figure): The figure the axis belongs to.
+        ax (plt.Axes): The axis containing the artists.
+        artists (list[Artist]): The artists to redraw. They are set to
+            be animated, i.e. full draws of the figure skip them.
+    """
+
+    def __init__(
+        self,
+        fig: plt.Figure,
+        ax: plt.Axes,
+        artists: list[Artist],
+    ) -> None:
+        self._fig = fig
+        self._ax = ax
+        self._artists = artists
+        for artist in artists:
+            artist.set_animated(True)
+        self._region: Optional[Bbox] = None
+        self._background = None
+        self._fig.canvas.mpl_connect("draw_event", self._on_draw)
+
+    def _on_draw(self, event) -> None:
+        # the region also covers the title above the axis
+        self._region = Bbox.union([
+            self._ax.bbox,
+            self._ax.title.get_window_extent(event.renderer),
+        ])
+        self._background = self._fig.canvas.copy_from_bbox(self._region)
+        self._draw_artists()
+
+    def _draw_artists(self) -> None:
+        for artist in self._artists:
+            if hasattr(artist, "do_3d_projection"):
+                artist.do_3d_projection()
+            self._ax.draw_artist(artist)
+
+    def update(self, full: bool = False) -> None:
+        """Shows the current state of the artists.
+
+        Args:
+            full (bool, optional): If true, the whole figure is drawn
+                again, which is needed if e.g. axis limits changed.
+                Defaults to False.
+        """
+        canvas = self._fig.canvas
+        if not canvas.supports_blit:
+            for artist in self._artists:
+                artist.set_animated(False)
+            canvas.draw()
+            canvas.flush_events()
+            return
+        if full or self._background is None:
+            canvas.draw()
+        else:
+            canvas.restore_region(self._background)
+            self._draw_artists()
+            canvas.blit(self._region)
+        canvas.flush_events()
+
+
 class ExploreLandscape(peal.callback.Callback):
     """Callback that can be used on environments that evolve individuals
     with one or two genes. These genes are then drawn in a 2d or 3d plot
@@ -26,6 +112,9 @@ class ExploreLandscape(peal.callback.Callback):
         sleep (float, optional): A number of seconds to wait before
             updating the plot and starting a new generation.
             Defaults to None.
+        trail_size (int, optional): The maximal number of individuals
+            from past generations that stay visible in the plot. If set
+            to None, all of them are shown. Defaults to None.
     """
 
     def __init__(
@@ -34,6 +123,7 @@ class ExploreLandscape(peal.callback.Callback):
         figax: Optional[tuple[plt.Figure, plt.Axes]] = None,
         fitness_range: Optional[tuple[float, float]] = None,
         sleep: Optional[float] = None,
+        trail_size: Optional[int] = None,
     ) -> None:
         if not isinstance(gene_pool, peal.genetics.NumberPool):
             raise ValueError("ExploreLandscape callback requires a NumberPool")
@@ -50,34 +140,72 @@ class ExploreLandscape(peal.callback.Callback):
         if fitness_range is not None:
             self.ax.set_zlim3d(fitness_range)
         self.ax.set_zlabel("Fitness")
+        # the limits are only read once and kept up to date here, as
+        # querying them from matplotlib in each generation is costly
+        self._zlim = tuple(self.ax.get_zlim3d())
 
-        self._last_scattering = self.ax.scatter(
+        # individuals of past generations are drawn by one black and
+        # the current ones by one red scatter that are updated in place
+        self._trail = self.ax.scatter(
             np.empty(0),
             np.empty(0),
             np.empty(0),
             color="black",
         )
+        self._current = self.ax.scatter(
+            np.empty(0),
+            np.empty(0),
+            np.empty(0),
+            color="red",
+        )
+        self._trail_data = np.empty((3, 64))
+        self._trail_count = 0
+        self._trail_size = trail_size
+        self._blitter = _Blitter(
+            self.fig,
+            self.ax,
+            [self._trail, self._current],
+        )
         self._sleep = sleep
 
+    def _extend_trail(self, points: np.ndarray) -> None:
+        # appends points to the trail buffer which doubles its capacity
+        # when full and keeps at most trail_size points
+        count = self._trail_count + points.shape[1]
+        if count > self._trail_data.shape[1]:
+            data = np.empty((3, max(count, 2*self._trail_data.shape[1])))
+            data[:, :self._trail_count] = (
+                self._trail_data[:, :self._trail_count]
+            )
+            self._trail_data = data
+        self._trail_data[:, self._trail_count:count] = points
+        if self._trail_size is not None and count > self._trail_size:
+            self._trail_data[:, :self._trail_size] = (
+                self._trail_data[:, count-self._trail_size:count]
+            )
+            count = self._trail_size
+        self._trail_count = count
+
     def on_generation_end(self, population: peal.Population) -> None:
-        self._last_scattering.set_color("black")
-        self._last_scattering = self.ax.scatter(
-            population.genes[:, 0],
-            population.genes[:, 1],
-            population.fitness,
-            color="red",
+        self._extend_trail(np.array(self._current._offsets3d))
+        self._trail._offsets3d = tuple(
+            self._trail_data[:, :self._trail_count]
+        )
+        genes = population.genes
+        fitness = population.fitness
+        self._current._offsets3d = (
+            genes[:, 0],
+            genes[:, 1],
+            fitness,
         )
 
-        min_ = min(population.fitness)
-        max_ = max(population.fitness)
-        if min_ > (old_min := self.ax.get_zlim3d()[0]):
-            min_ = old_min
-        if max_ < (old_max := self.ax.get_zlim3d()[1]):
-            max_ = old_max
-        self.ax.set_zlim3d(min_, max_)
+        limits = _grow_limits(self._zlim, fitness.min(), fitness.max())
+        rescale = limits != self._zlim
+        if rescale:
+            self.ax.set_zlim3d(limits)
+            self._zlim = limits
 
-        self.fig.canvas.draw()
-        self.fig.canvas.flush_events()
+        self._blitter.update(full=rescale)
         if self._sleep is not None:
             time.sleep(self._sleep)
 
@@ -99,6 +227,10 @@ class VisualTracker(peal.callback.Callback):
         sleep (float, optional): A number of seconds to wait before
             updating the plot and starting a new generation.
             Defaults to None.
+        max_generations (int, optional): The expected number of
+            generations. Tracked values are stored in arrays of this
+            size which grow if more generations are passed.
+            Defaults to 100.
     """
 
     def __init__(
@@ -107,6 +239,7 @@ class VisualTracker(peal.callback.Callback):
         figax: Optional[tuple[plt.Figure, plt.Axes]] = None,
         fitness_range: Optional[tuple[float, float]] = None,
         sleep: Optional[float] = None,
+        max_generations: int = 100,
     ) -> None:
         if figax is None:
             self.fig, self.ax = plt.subplots(1, 1)
@@ -117,40 +250,53 @@ class VisualTracker(peal.callback.Callback):
         if fitness_range is None:
             fitness_range = (0, 1)
         self.ax.set_ylim(*fitness_range)
+        # cached limits of the axis, see ExploreLandscape
+        self._xmax = 10
+        self._ylim = tuple(self.ax.get_ylim())
 
         self._gen = 0
+        self._xdata = np.empty(max(max_generations, 1))
+        self._ydata = np.empty(max(max_generations, 1))
         self._line, = self.ax.plot(np.empty(0), np.empty(0), marker="x")
+        self._blitter = _Blitter(
+            self.fig,
+            self.ax,
+            [self._line, self.ax.title],
+        )
         self._sleep = sleep
         self._kind = kind
 
     def on_generation_end(self, population: peal.Population) -> None:
         self._gen += 1
-        if self._gen > self.ax.get_xlim()[1]:
-            self.ax.set_xlim(0, self._gen + 9)
+        rescale = False
+        if self._gen > self._xmax:
+            self._xmax = 2 * self._gen
+            self.ax.set_xlim(0, self._xmax)
+            rescale = True
+        fitness = population.fitness
         if self._kind == "max":
-            value = max(population.fitness)
+            value = float(fitness.max())
             self.ax.set_title(f"Maximal Fitness: {value:.2f}")
         elif self._kind == "avg":
-            value = sum(population.fitness) / population.size
+            value = float(fitness.mean())
             self.ax.set_title(f"Average Fitness: {value:.2f}")
         else:
-            value = min(population.fitness)
+            value = float(fitness.min())
             self.ax.set_title(f"Minimal Fitness: {value:.2f}")
-        if value > self.ax.get_ylim()[1]:
-            self.ax.set_ylim(self.ax.get_ylim()[0], value)
-        if value < self.ax.get_ylim()[0]:
-            self.ax.set_ylim(value, self.ax.get_ylim()[1])
+        limits = _grow_limits(self._ylim, value, value)
+        if limits != self._ylim:
+            self.ax.set_ylim(limits)
+            self._ylim = limits
+            rescale = True
+        if self._gen > self._xdata.size:
+            self._xdata = np.resize(self._xdata, 2*self._xdata.size)
+            self._ydata = np.resize(self._ydata, 2*self._ydata.size)
+        self._xdata[self._gen-1] = self._gen
+        self._ydata[self._gen-1] = value
         self._line.set_data(
-            np.concatenate((
-                self._line.get_data()[0],
-                [self._gen],
-            )),
-            np.concatenate((
-                self._line.get_data()[1],
-                [value],
-            )),
+            self._xdata[:self._gen],
+            self._ydata[:self._gen],
         )
-        self.fig.canvas.draw()
-        self.fig.canvas.flush_events()
+        self._blitter.update(full=rescale)
         if self._sleep is not None:
             time.sleep(self._sleep)
\ No newline at end of file
@@ -1,7 +1,3 @@
-import importlib.metadata
-
-__version__ = importlib.metadata.version("peal")
-
 from peal import core
 from peal.core import callback
 
@@ -15,7 +11,17 @@ from peal.fitness import (
 )
 
 from peal import genetics
+from peal import rng
 from peal import individual
 from peal.individual import Individual
 from peal import population
 from peal.population import Population
+
+
+def __getattr__(name: str) -> str:
+    # the version is looked up lazily as importing importlib.metadata
+    # takes a considerable part of the import time of peal
+    if name == "__version__":
+        import importlib.metadata
+        return importlib.metadata.version("peal")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
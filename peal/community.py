@@ -1,4 +1,12 @@
-from typing import Iterable, Optional, Sequence, SupportsIndex, Union, overload
+from typing import (
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    SupportsIndex,
+    Union,
+    overload,
+)
 
 from peal.population import Population
 
@@ -16,7 +24,6 @@ class Community:
         self,
         populations: Optional[Union[Population, Iterable[Population]]] = None,
     ):
-        self._iter_id = -1
         self._populations: list[Population] = []
         if populations is not None:
             self.integrate(populations)
@@ -58,15 +65,11 @@ class Community:
         """
         return Community(tuple(pop.deepcopy() for pop in self._populations))
 
-    def __iter__(self) -> "Community":
-        self._iter_id = -1
-        return self
+    def __iter__(self) -> Iterator[Population]:
+        return iter(self._populations)
 
-    def __next__(self) -> Population:
-        if self._iter_id == len(self._populations) - 1:
-            raise StopIteration
-        self._iter_id += 1
-        return self._populations[self._iter_id]
+    def __len__(self) -> int:
+        return len(self._populations)
 
     @overload
     def __getitem__(self, key: SupportsIndex) -> Population:
@@ -80,12 +83,24 @@ class Community:
         self,
         key: Union[SupportsIndex, slice, Sequence[int]],
     ) -> Union["Community", Population]:
+        if isinstance(key, int):
+            return self._populations[key]
         if isinstance(key, slice):
-            return Community(self._populations[key])
+            return self._from_list(self._populations[key])
         if isinstance(key, Sequence):
-            return Community([self._populations[i] for i in key])
+            return self._from_list(
+                list(map(self._populations.__getitem__, key))
+            )
         return self._populations.__getitem__(key)
 
+    @classmethod
+    def _from_list(cls, populations: list[Population]) -> "Community":
+        # creates a community out of populations that are known to be of
+        # the right type, without checking them again
+        community = cls()
+        community._populations = populations
+        return community
+
     @overload
     def __setitem__(self, key: SupportsIndex, value: Population) -> None:
         ...
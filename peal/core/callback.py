@@ -1,6 +1,8 @@
+from typing import Any, Optional
+
 import numpy as np
 
-from peal.genetics import GenePool, GeneType
+from peal.genetics import GenePool, GeneType, IntegerPool
 from peal.population import Population
 
 
@@ -47,8 +49,9 @@ class BestWorst(Callback):
         self.worst = Population()
 
     def on_generation_end(self, population: Population) -> None:
-        self.best.integrate(max(population, key=lambda ind: ind.fitness))
-        self.worst.integrate(min(population, key=lambda ind: ind.fitness))
+        fitness = population.fitness
+        self.best.integrate(population[int(np.argmax(fitness))])
+        self.worst.integrate(population[int(np.argmin(fitness))])
 
 
 class Diversity(Callback):
@@ -64,7 +67,22 @@ class Diversity(Callback):
         if GeneType.CONST_SIZE not in self._pool.typing:
             raise ValueError("Diversity not available for genomes of "
                              "variable length")
-        self.gene_diversity: np.ndarray = np.empty((0, 1), dtype=float)
+        self._metric = GeneType.METRIC in self._pool.typing
+        self._rows: list[np.ndarray] = []
+        self._loci = 1
+        self._gene_diversity: Optional[np.ndarray] = None
+
+    @property
+    def gene_diversity(self) -> np.ndarray:
+        """The gene diversity at each locus in a genome, with one row
+        for each generation.
+        """
+        if self._gene_diversity is None:
+            self._gene_diversity = np.array(
+                self._rows,
+                dtype=float,
+            ).reshape(len(self._rows), self._loci)
+        return self._gene_diversity
 
     @property
     def diversity(self) -> np.ndarray:
@@ -74,7 +92,7 @@ class Diversity(Callback):
         it is the mean of standard deviations across the genes of a
         population over multiple generations.
         """
-        if GeneType.METRIC not in self._pool.typing:
+        if not self._metric:
             return (
                 self._pool.size / (self._pool.size - 1)
                 * self.gene_diversity.mean(axis=1)
@@ -82,23 +100,53 @@ class Diversity(Callback):
         return self.gene_diversity.mean(axis=1)
 
     def on_start(self, population: Population) -> None:
-        self.gene_diversity = np.zeros(
-            (0, population[0].genes.shape[0]),
-            dtype=float
-        )
+        self._rows = []
+        self._loci = population[0].genes.shape[0]
+        self._gene_diversity = None
+
+    def _allele_counts(self, genes: np.ndarray) -> np.ndarray:
+        # number of occurrences of each allele at each locus, the result
+        # has shape (loci, alleles) and is computed by one bincount over
+        # allele indices that are offset by locus
+        pool = self._pool
+        if (isinstance(pool, IntegerPool)
+                and genes.min() >= pool.lower
+                and genes.max() <= pool.upper):
+            alleles = np.subtract(genes, pool.lower, dtype=np.intp)
+            n_alleles = int(pool.size)
+        else:
+            try:
+                values, alleles = np.unique(genes, return_inverse=True)
+                n_alleles = len(values)
+            except TypeError:
+                # alleles that cannot be sorted are indexed in order of
+                # their first appearance
+                index: dict[Any, int] = {}
+                alleles = np.fromiter(
+                    (index.setdefault(v, len(index)) for v in genes.flat),
+                    dtype=np.intp,
+                    count=genes.size,
+                )
+                n_alleles = len(index)
+            alleles = alleles.reshape(genes.shape)
+        loci = genes.shape[1]
+        alleles += n_alleles * np.arange(loci)
+        return np.bincount(
+            alleles.ravel(),
+            minlength=loci * n_alleles,
+        ).reshape(loci, n_alleles)
 
     def on_generation_end(self, population: Population) -> None:
-        div: np.ndarray = np.ones((population[0].genes.shape[0],))
-        if GeneType.METRIC not in self._pool.typing:
-            unique = set(np.hstack(list(population.genes.flatten())))
-            for value in unique:
-                div -= (
-                    np.sum(population.genes == value, axis=0)
-                    / population.size
-                )**2
+        div: np.ndarray = np.ones((self._loci,))
+        genes = population.genes
+        if self._metric:
+            div = np.std(genes, axis=0)
         else:
-            div = np.std(population.genes, axis=0)
-        self.gene_diversity = np.vstack([
-            self.gene_diversity,
-            div
-        ])
+            counts = self._allele_counts(genes)
+            # sum of squared allele frequencies without temporaries of
+            # the counts' size
+            div -= (
+                np.einsum("ij,ij->i", counts, counts) / population.size**2
+            )
+        self._rows.append(div)
+        self._gene_diversity = None
@@ -1,12 +1,63 @@
-from dataclasses import dataclass
+from concurrent.futures import Executor
+from dataclasses import dataclass, replace
+from functools import partial
+from typing import Callable, Optional
+
+import numpy as np
 
 from peal.community import Community
 from peal.core.callback import Callback
 from peal.core.strategy import Strategy
 from peal.fitness import Fitness
-from peal.genetics import GenePool
+from peal.genetics import GenePool, GeneType
 from peal.individual import Individual
+from peal.operators.iteration import FullIteration
+from peal.operators.mutation import MatrixMutation
+from peal.operators.operator import Operator
+from peal.operators.reproduction import Crossover
 from peal.population import Population
+from peal.rng import local_generator, spawn_generators
+
+
+def _dirty(population: Population) -> Population:
+    # individuals whose fitness is outdated, e.g. unchanged clones of
+    # evaluated parents are skipped; if all of them are outdated, the
+    # population is returned as is to keep its contiguous gene block
+    dirty = [ind for ind in population if ind.dirty]
+    if len(dirty) == population.size:
+        return population
+    return Population(tuple(dirty))
+
+
+def _processes_like(operator: Operator, base: type[Operator]) -> bool:
+    # operators are only fused if they process whole populations in the
+    # same way as the given base class, subclasses that override this
+    # are applied by their own process method
+    return (type(operator).process is base.process
+            and (type(operator)._process_population
+                 is base._process_population)
+            and isinstance(operator.iter_type, FullIteration))
+
+
+def _evolve(
+    environment: "Environment",
+    strategy: Strategy,
+    population: Population,
+    generator: np.random.Generator,
+    generations: int,
+    history: bool = True,
+) -> list[Population]:
+    # evolves one island, this is a module level function so it can be
+    # pickled for process based executors; the populations of all
+    # generations are only returned if callbacks need them, otherwise
+    # only the last one is
+    populations = [population]
+    with local_generator(generator):
+        for _ in range(generations):
+            population = environment._generation(strategy, population)
+            if history:
+                populations.append(population)
+    return populations if history else [population]
 
 
 @dataclass
@@ -20,11 +71,104 @@ class Environment:
         pool (GenePool): The gene pool used for individual
             initialization.
         fitness (Fitness): The fitness to use for evaluation off
-            individuals.
+            individuals. Only individuals that are marked as
+            :attr:`~peal.individual.Individual.dirty` are evaluated
+            in each generation, unless ``evaluate_all`` is set. A
+            fitness with a ``cache_size`` also skips the evaluation of
+            genomes it has seen before.
+        executor (Executor, optional): An executor that is used to
+            evolve the populations of a community concurrently, i.e. as
+            islands that only interact through migration. Each island
+            draws random numbers from its own generator spawned from
+            the one in :mod:`peal.rng`, so seeded runs are
+            reproducible. Callbacks are still called in the main
+            thread after each batch of generations. Process based
+            executors require a picklable environment and strategy.
+            Defaults to None.
+        evaluate_all (bool, optional): If set to true, all offspring
+            individuals are evaluated in each generation, including
+            those that are not dirty. This is needed for noisy fitness
+            functions. Defaults to False.
     """
 
     pool: GenePool
     fitness: Fitness
+    executor: Optional[Executor] = None
+    evaluate_all: bool = False
+
+    def _outdated(self, population: Population) -> Population:
+        return population if self.evaluate_all else _dirty(population)
+
+    def _create_population(self, size: int) -> Population:
+        if GeneType.CONST_SIZE in self.pool.typing:
+            return Population.from_genes(self.pool.random_genomes(size))
+        return Population(tuple(
+            Individual(self.pool.random_genome()) for _ in range(size)
+        ))
+
+    def _reproduce(
+        self,
+        strategy: Strategy,
+        parents: Population,
+    ) -> Population:
+        reproduction, mutation = strategy.reproduction, strategy.mutation
+        if (isinstance(reproduction, Crossover)
+                and isinstance(mutation, MatrixMutation)
+                and _processes_like(reproduction, Crossover)
+                and _processes_like(mutation, MatrixMutation)
+                and parents.size > 0):
+            # the crossed over genes are mutated before individuals are
+            # created for them
+            origin, genes = reproduction.cross(parents)
+            if origin.size == 0:
+                return Population()
+            return mutation.mutate(origin, genes)
+        return mutation.process(reproduction.process(parents))
+
+    def _generation(
+        self,
+        strategy: Strategy,
+        parents: Population,
+    ) -> Population:
+        offspring = self._reproduce(strategy, parents)
+        self.fitness.evaluate(self._outdated(offspring))
+        return self._survive(strategy, offspring, parents)
+
+    def _survive(
+        self,
+        strategy: Strategy,
+        offspring: Population,
+        parents: Population,
+    ) -> Population:
+        offspring, = strategy.integration.process(
+            Community._from_list([offspring, parents])
+        )
+        return strategy.selection.process(offspring)
+
+    def _community_generation(
+        self,
+        strategy: Strategy,
+        populations: Community,
+        on_generation_start: tuple[Callable[[Population], None], ...],
+        on_generation_end: tuple[Callable[[Population], None], ...],
+    ) -> Community:
+        # one generation for all populations where the offspring of
+        # all populations is evaluated at once
+        for parents in populations:
+            for hook in on_generation_start:
+                hook(parents)
+        offspring = Community(tuple(
+            self._reproduce(strategy, parents) for parents in populations
+        ))
+        self.fitness.evaluate(Community(tuple(
+            self._outdated(children) for children in offspring
+        )))
+        survivors = Community()
+        for children, parents in zip(offspring, populations):
+            survivors.integrate(self._survive(strategy, children, parents))
+            for hook in on_generation_end:
+                hook(survivors[-1])
+        return survivors
 
     def execute(self, strategy: Strategy, callbacks: list[Callback]) -> None:
         """Executes the given evolutionary strategy.
@@ -36,13 +180,22 @@ class Environment:
                 given strategy.
         """
         callbacks = [] if callbacks is None else callbacks
+        # callback methods are looked up once and not in each generation
+        on_generation_start = tuple(
+            callback.on_generation_start for callback in callbacks
+        )
+        on_generation_end = tuple(
+            callback.on_generation_end for callback in callbacks
+        )
+        # islands are evolved by a copy without the executor, which can
+        # not be pickled for other processes
+        island_environment = replace(self, executor=None)
 
         parent_populations = Community()
         for i in range(strategy.init_populations):
-            population = Population()
-            for _ in range(strategy.init_individuals):
-                population.integrate(Individual(self.pool.random_genome()))
-            parent_populations.integrate(population)
+            parent_populations.integrate(self._create_population(
+                strategy.init_individuals
+            ))
             if strategy.select_parent_populations:
                 self.fitness.evaluate(parent_populations[-1])
             for callback in callbacks:
@@ -53,24 +206,57 @@ class Environment:
                 parent_populations
             )
 
-            for _ in range(strategy.generations):
-                for i, parents in enumerate(offspring_populations):
-                    for callback in callbacks:
-                        callback.on_generation_start(parents)
-
-                    offspring = strategy.reproduction.process(parents)
-                    offspring = strategy.mutation.process(offspring)
-                    self.fitness.evaluate(offspring)
-                    offspring, = strategy.integration.process(
-                        Community((offspring, parents))
+            interval = strategy.generations
+            if strategy.migration is not None:
+                interval = strategy.migration_interval
+            for done in range(0, strategy.generations, max(interval, 1)):
+                epoch = min(interval, strategy.generations - done)
+                if self.executor is None and strategy.batch_fitness:
+                    for _ in range(epoch):
+                        offspring_populations = self._community_generation(
+                            strategy,
+                            offspring_populations,
+                            on_generation_start,
+                            on_generation_end,
+                        )
+                elif self.executor is None:
+                    for _ in range(epoch):
+                        for i, parents in enumerate(offspring_populations):
+                            for hook in on_generation_start:
+                                hook(parents)
+                            offspring_populations[i] = self._generation(
+                                strategy,
+                                parents,
+                            )
+                            for hook in on_generation_end:
+                                hook(offspring_populations[i])
+                else:
+                    histories = list(self.executor.map(
+                        partial(
+                            _evolve,
+                            island_environment,
+                            strategy,
+                            generations=epoch,
+                            history=bool(callbacks),
+                        ),
+                        offspring_populations,
+                        spawn_generators(offspring_populations.size),
+                    ))
+                    for generation in range(epoch if callbacks else 0):
+                        for history in histories:
+                            for hook in on_generation_start:
+                                hook(history[generation])
+                            for hook in on_generation_end:
+                                hook(history[generation+1])
+                    offspring_populations = Community(
+                        tuple(history[-1] for history in histories)
                     )
-                    offspring_populations[i] = strategy.selection.process(
-                        offspring
+                if (strategy.migration is not None
+                        and done + epoch < strategy.generations):
+                    offspring_populations = strategy.migration.process(
+                        offspring_populations
                     )
 
-                    for callback in callbacks:
-                        callback.on_generation_end(offspring_populations[i])
-
             if strategy.select_parent_populations:
                 for population in parent_populations:
                     offspring_populations.integrate(population)
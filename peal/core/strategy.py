@@ -1,13 +1,17 @@
 import re
 from dataclasses import dataclass, field
-from typing import ClassVar
+from typing import ClassVar, Optional
 
 from peal.operators.clash import EquiMix
 from peal.operators.integration import FirstThingsFirst
 from peal.operators.iteration import NRandomBatchesIteration
 from peal.operators.mutation import NormalDist
 from peal.operators.operator import Operator
-from peal.operators.reproduction import Copy, DiscreteRecombination
+from peal.operators.reproduction import (
+    Copy,
+    DiscreteRecombination,
+    RandomCopy,
+)
 from peal.operators.selection import Best, BestMean
 
 
@@ -50,9 +54,23 @@ class Strategy:
             operator that will be used to create new populations out of
             the already existing ones in the community.
             Defaults to :class:`~peal.operations.reproduction.CCopy`.
+        migration (Operator[Community], optional): An operator that
+            exchanges individuals between the populations of the
+            community while they evolve, e.g.
+            :class:`~peal.operators.clash.Migration`. If set to None,
+            populations evolve in isolation. Defaults to None.
+        migration_interval (int, optional): The number of generations
+            between two migrations. Defaults to 1.
+        batch_fitness (bool, optional): If true, the offspring of all
+            populations in the community is evaluated by one call of the
+            fitness in each generation. This is useful for batched
+            fitness methods. Callbacks then see the start of the
+            generation for all populations before its end. This option
+            is ignored if the populations are evolved concurrently.
+            Defaults to False.
     """
 
-    SIGNATURE_RE: ClassVar[str] = (
+    SIGNATURE_RE: ClassVar[re.Pattern[str]] = re.compile(
         r"(?:(\d+)(/\d+)?(\+|,)(\d+))?\((\d+)(/\d+)?(\+|,)(\d+)\)(\^\d+)?"
     )
 
@@ -78,6 +96,10 @@ class Strategy:
         default_factory=Copy,
     )
 
+    migration: Optional[Operator] = None
+    migration_interval: int = 1
+    batch_fitness: bool = False
+
     @staticmethod
     def from_string(string: str, population_generations: int) -> "Strategy":
         """Creates an evolutionary strategy based on the notation
@@ -112,7 +134,7 @@ class Strategy:
             population_generations (int): An integer characterizing the
                 number of iterations a community is evolved.
         """
-        match = re.search(Strategy.SIGNATURE_RE, string)
+        match = Strategy.SIGNATURE_RE.search(string)
         if match is None:
             raise ValueError("Given signature does not match the "
                              "required pattern")
@@ -142,11 +164,17 @@ class Strategy:
             in_size=pop_lambda+pop_mu if pop_parent_selection else pop_lambda,
             out_size=pop_mu,
         )
-        reproduction = DiscreteRecombination(in_size=ind_rho)
-        reproduction.iter_type = NRandomBatchesIteration(
-            batch_size=ind_rho,
-            total=ind_lambda,
-        )
+        reproduction: Operator
+        if ind_rho == 1:
+            # offspring are copies of single parents, which are all
+            # drawn at once
+            reproduction = RandomCopy(total=ind_lambda)
+        else:
+            reproduction = DiscreteRecombination(in_size=ind_rho)
+            reproduction.iter_type = NRandomBatchesIteration(
+                batch_size=ind_rho,
+                total=ind_lambda,
+            )
         pop_reproduction = EquiMix(
             in_size=pop_mu,
             out_size=pop_lambda,
@@ -1,10 +1,19 @@
-from typing import Any, Callable, Optional, Union
-from peal.community import Community
+from collections import OrderedDict, deque
+from concurrent.futures import Executor
+import os
+from threading import Lock
+from typing import Any, Callable, Optional, Union, overload
+
+import numpy as np
 
+from peal.community import Community
 from peal.genetics import GPTerminal
 from peal.population import Individual, Population
 
 
+_CacheKey = tuple[str, tuple[int, ...], bytes]
+
+
 class Fitness:
     """Class that is responsible for calculating the fitness of
     individuals in an environment.
@@ -14,39 +23,191 @@ class Fitness:
             single individual. This method should expect a value of
             type :class:`~peal.population.individual.Individual` and
             return a float value.
+        batched (bool, optional): If set to true, ``method`` is expected
+            to evaluate a whole population at once. It then receives the
+            genes of all individuals in the population as a two
+            dimensional numpy array (one row for each individual) and
+            has to return a one dimensional array of fitness values.
+            This only works for individuals with genomes of the same
+            length. The method may move the genes to a GPU, e.g. with
+            CuPy or JAX, and return the resulting device array, which
+            is then copied back to the host in a single transfer.
+            Defaults to False.
+        executor (Executor, optional): An executor from
+            :mod:`concurrent.futures` that is used to evaluate the
+            individuals of a population in parallel. The executor is
+            reused for every evaluation and has to be shut down by the
+            user. For a ``ProcessPoolExecutor``, ``method`` has to be
+            picklable. For batched methods, the gene matrix is split
+            into one chunk for each available CPU and the chunks are
+            evaluated in parallel. Defaults to None.
+        cache_size (int, optional): If set to a positive integer, the
+            fitness values of up to this number of recently evaluated
+            genomes are remembered. Individuals with the same genes as
+            one of the cached genomes are then not evaluated again.
+            Genomes of object data type, e.g. GP trees, are never
+            cached. The cache can be shared by populations that are
+            evaluated concurrently. This should only be used for
+            deterministic fitness methods. Defaults to 0.
     """
 
-    def __init__(self, method: Callable[[Individual], float]):
+    def __init__(
+        self,
+        method: Callable[..., Any],
+        batched: bool = False,
+        executor: Optional[Executor] = None,
+        cache_size: int = 0,
+    ):
         self._method = method
+        self._batched = batched
+        self._executor = executor
+        self._cache_size = cache_size
+        self._cache: OrderedDict[_CacheKey, float] = OrderedDict()
+        self._cache_lock = Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # the lock cannot be pickled, e.g. for evaluations in other
+        # processes, which start with an empty cache
+        state = self.__dict__.copy()
+        del state["_cache_lock"]
+        state["_cache"] = OrderedDict()
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._cache_lock = Lock()
+
+    @property
+    def batched(self) -> bool:
+        """True if the fitness method evaluates whole populations at
+        once.
+        """
+        return self._batched
+
+    def clear_cache(self) -> None:
+        """Removes all remembered fitness values."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def _evaluate_population(self, population: Population) -> None:
+        if self._cache_size <= 0:
+            self._compute(population)
+        else:
+            self._compute_cached(population)
+        for ind in population:
+            ind.dirty = False
+
+    def _compute_cached(self, population: Population) -> None:
+        missing = Population()
+        keys: list[Optional[_CacheKey]] = []
+        with self._cache_lock:
+            for ind in population:
+                # object genomes only hold references to alleles and
+                # are not cached, equal bytes of genomes with another
+                # data type or shape have their own key
+                key = None if ind.genes.dtype == object else (
+                    ind.genes.dtype.str,
+                    ind.genes.shape,
+                    ind.genes.tobytes(),
+                )
+                if key is not None and key in self._cache:
+                    self._cache.move_to_end(key)
+                    ind.fitness = self._cache[key]
+                else:
+                    missing.integrate(ind)
+                    keys.append(key)
+        self._compute(missing)
+        with self._cache_lock:
+            for ind, key in zip(missing, keys):
+                if key is not None:
+                    self._cache[key] = ind.fitness
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+    def _compute(self, population: Population) -> None:
+        if population.size == 0:
+            return
+        if self._batched:
+            if self._executor is not None:
+                chunks = np.array_split(
+                    population.genes,
+                    min(population.size, os.cpu_count() or 1),
+                )
+                values = np.concatenate(
+                    tuple(self._executor.map(self._method, chunks))
+                )
+            else:
+                values = self._method(population.genes)
+            if hasattr(values, "tolist"):
+                # one conversion (or device transfer) for all values
+                values = values.tolist()
+            for ind, value in zip(population, values):
+                ind.fitness = float(value)
+        elif self._executor is not None:
+            values = self._executor.map(self._method, population)
+            for ind, value in zip(population, values):
+                ind.fitness = value
+        else:
+            for ind in population:
+                ind.fitness = self._method(ind)
 
     def evaluate(
         self,
         objects: Union[Individual, Population, Community],
     ) -> None:
         """Evaluates the fitness of individuals by changing their
-        ``fitness`` attribute directly.
+        ``fitness`` attribute directly. For batched fitness methods, all
+        populations of a community are evaluated by a single call.
 
         Args:
             objects (Individual | Population | Community): A single
                 individual, a population or a community to evaluate.
         """
         if isinstance(objects, Community):
-            for pop in objects:
-                for ind in pop:
-                    ind.fitness = self._method(ind)
-        if isinstance(objects, Population):
-            for ind in objects:
-                ind.fitness = self._method(ind)
+            if self._batched:
+                self._evaluate_population(Population(tuple(
+                    ind for pop in objects for ind in pop
+                )))
+            else:
+                for pop in objects:
+                    self._evaluate_population(pop)
+        elif isinstance(objects, Population):
+            self._evaluate_population(objects)
         elif isinstance(objects, Individual):
-            objects.fitness = self._method(objects)
+            self._evaluate_population(Population(objects))
         else:
             raise TypeError(f"Cannot evaluate object of type {type(objects)}")
 
-    def __call__(self, population: Union[Individual, Population]) -> None:
-        self.evaluate(population)
+    def __call__(
+        self,
+        objects: Union[Individual, Population, Community],
+    ) -> None:
+        self.evaluate(objects)
 
 
+@overload
 def fitness(method: Callable[[Individual], float]) -> Fitness:
+    ...
+
+
+@overload
+def fitness(
+    method: None = None,
+    *,
+    batched: bool = False,
+    executor: Optional[Executor] = None,
+    cache_size: int = 0,
+) -> Callable[[Callable[..., Any]], Fitness]:
+    ...
+
+
+def fitness(
+    method: Optional[Callable[..., Any]] = None,
+    *,
+    batched: bool = False,
+    executor: Optional[Executor] = None,
+    cache_size: int = 0,
+) -> Union[Fitness, Callable[[Callable[..., Any]], Fitness]]:
     """Decorator for a fitness method.
 
     Declaring your own fitness function is possible with the class
@@ -54,8 +215,54 @@ def fitness(method: Callable[[Individual], float]) -> Fitness:
     on your evaluation method.
     The method you want to decorate will need to have the same arguments
     and return types as described in the mentioned class.
+    Keyword arguments of :class:`~peal.fitness.Fitness` can be given
+    to the decorator, e.g. ``@fitness(batched=True)`` for methods that
+    evaluate the genes of a whole population at once.
     """
-    return Fitness(method=method)
+    def decorator(method_: Callable[..., Any]) -> Fitness:
+        return Fitness(
+            method=method_,
+            batched=batched,
+            executor=executor,
+            cache_size=cache_size,
+        )
+
+    if method is None:
+        return decorator
+    return decorator(method)
+
+
+def negative_mse(*targets: np.ndarray) -> Fitness:
+    """Creates a batched fitness that computes the negative mean squared
+    error between the genes of individuals and a target genome. If
+    multiple targets are given, the errors to all targets are summed
+    up.
+
+    Args:
+        targets (np.ndarray): One or more target genomes of the same
+            length as the genomes of evaluated individuals.
+    """
+    target = np.asarray(targets, dtype=float)
+    length = target.shape[1]
+
+    if len(target) == 1:
+        def evaluate(genes: np.ndarray) -> np.ndarray:
+            diff = genes - target[0]
+            return -np.einsum("ij,ij->i", diff, diff) / length
+        return Fitness(method=evaluate, batched=True)
+
+    # with the mean target M, sum_t |T_t - G|^2 = n |G - M|^2
+    # + sum_t |T_t - M|^2, centering avoids the cancellation of large
+    # terms in the expansion of the squares
+    center = target.mean(axis=0)
+    spread = np.einsum("ij,ij->", target - center, target - center)
+
+    def evaluate_multiple(genes: np.ndarray) -> np.ndarray:
+        diff = np.asarray(genes, dtype=float) - center
+        error = len(target) * np.einsum("ij,ij->i", diff, diff) + spread
+        return -error / length
+
+    return Fitness(method=evaluate_multiple, batched=True)
 
 
 def gp_evaluate(
@@ -77,32 +284,85 @@ def gp_evaluate(
         A value that represents the result of the tree evaluation.
     """
     argset = arguments if arguments is not None else {}
-    if "x" not in argset:
-        print(80*"=")
-        print(f"{argset=}")
-    values: list[Any] = []
-    index = len(individual.genes) - 1
-    while index >= 0:
-        while isinstance(individual.genes[index], GPTerminal):
-            if individual.genes[index].allocated:
-                values.insert(0, individual.genes[index].value)
+    # genes are stored in breadth-first order, so walking them backwards
+    # each callable consumes the oldest values computed so far
+    values: deque[Any] = deque()
+    for gene in reversed(individual.genes):
+        if isinstance(gene, GPTerminal):
+            if gene.allocated:
+                values.appendleft(gene.value)
             else:
-                name = individual.genes[index].name
-                if name not in argset:
-                    raise RuntimeError(f"Argument name {name} "
+                if gene.name not in argset:
+                    raise RuntimeError(f"Argument name {gene.name} "
                                        "not supplied")
-                values.insert(0, argset[name])
-            index -= 1
-        argcount = len(individual.genes[index].argtypes)
-        values.insert(
-            0,
-            individual.genes[index](*values[-argcount:])
-        )
-        values = values[:len(values)-argcount]
-        index -= 1
+                values.appendleft(argset[gene.name])
+        else:
+            args = [values.pop() for _ in range(len(gene.argtypes))]
+            args.reverse()
+            values.appendleft(gene(*args))
     return values[0]
 
 
+def gp_evaluate_batch(
+    individual: Individual,
+    arguments: list[dict[str, Any]],
+) -> np.ndarray:
+    """Evaluates an individual with a genetic programming tree-like
+    genome for multiple sets of arguments at once. The values of each
+    argument are stacked into a numpy array and the tree is only
+    traversed a single time. This requires all callables in the tree to
+    support numpy broadcasting, e.g. by using numpy ufuncs.
+
+    Args:
+        individual (Individual): The individual to evalutate.
+        arguments (list[dict[str, Any]]): A list of dictionaries
+            mapping argument names to values. All dictionaries have to
+            contain the same names.
+
+    Returns:
+        np.ndarray: An array with one result for each set of arguments.
+    """
+    if len(arguments) == 0:
+        return np.empty(0)
+    stacked = {
+        name: np.array([argset[name] for argset in arguments])
+        for name in arguments[0]
+    }
+    return np.broadcast_to(
+        gp_evaluate(individual, stacked),
+        (len(arguments), ),
+    ).copy()
+
+
+def _first_value(values: Any) -> float:
+    return float(values[0])
+
+
+class _GPEvaluation:
+    # evaluates a GP individual for the given sets of arguments, this is
+    # a module level class instead of a closure so it can be pickled for
+    # process based executors
+
+    def __init__(
+        self,
+        arguments: list[dict[str, Any]],
+        evaluation: Callable[[Any], float],
+        vectorized: bool,
+    ):
+        self.arguments = arguments
+        self.evaluation = evaluation
+        self.vectorized = vectorized
+
+    def __call__(self, individual: Individual) -> float:
+        if self.vectorized:
+            return self.evaluation(
+                gp_evaluate_batch(individual, self.arguments)
+            )
+        return self.evaluation(
+            [gp_evaluate(individual, argset) for argset in self.arguments]
+        )
+
+
 class GPFitness(Fitness):
     """Fitness to use in a genetic programming process.
     The fitness will be the return value of the genome tree of
@@ -120,17 +380,27 @@ class GPFitness(Fitness):
             supplied multiple dictionaries in ``arguments``, i.e. one
             value for each set of arguments given. Defaults to the float
             value of for an empty set of arguments.
+        executor (Executor, optional): An executor that evaluates the
+            individuals of a population in parallel. See
+            :class:`Fitness` for details. Defaults to None.
+        vectorized (bool, optional): If set to true, the tree of an
+            individual is evaluated for all sets of arguments at once
+            using :meth:`gp_evaluate_batch`. ``evaluation`` then
+            receives a numpy array instead of a list. Defaults to False.
     """
 
     def __init__(
         self,
         arguments: Optional[list[dict[str, Any]]] = None,
-        evaluation: Optional[Callable[[list[Any]], float]] = None,
+        evaluation: Optional[Callable[[Any], float]] = None,
+        executor: Optional[Executor] = None,
+        vectorized: bool = False,
     ):
-        eval_ = evaluation if evaluation is not None else (
-            lambda array: float(array[0])
+        super().__init__(
+            _GPEvaluation(
+                arguments if arguments is not None else [{}],
+                evaluation if evaluation is not None else _first_value,
+                vectorized,
+            ),
+            executor=executor,
         )
-        argsets = arguments if arguments is not None else [{}]
-        super().__init__(lambda individual: eval_(
-            [gp_evaluate(individual, argset) for argset in argsets]
-        ))
@@ -4,6 +4,9 @@ from enum import Enum, auto
 from typing import Any, Callable, Optional, Union, get_type_hints
 
 import numpy as np
+from numpy.typing import DTypeLike
+
+from peal.rng import get_generator
 
 
 class GeneType(Enum):
@@ -63,6 +66,32 @@ class GenePool(ABC):
                 individual.
         """
 
+    def random_genomes(self, n: int, **kwargs) -> np.ndarray:
+        """Generates the genomes of ``n`` new individuals at once. Gene
+        pools of constant size genomes can override this method to draw
+        all alleles in a single call to the random number generator.
+
+        Args:
+            n (int): The number of genomes to create.
+
+        Returns:
+            np.ndarray: An array with one genome in each row.
+        """
+        return np.array([self.random_genome(**kwargs) for _ in range(n)])
+
+
+def _narrow_dtype(lower: int, upper: int) -> np.dtype:
+    # smallest integer type holding all values in [lower, upper]
+    dtypes: tuple[type[np.integer[Any]], ...] = (
+        np.uint8, np.int8, np.uint16, np.int16,
+        np.uint32, np.int32, np.uint64, np.int64,
+    )
+    for dtype in dtypes:
+        info = np.iinfo(dtype)
+        if info.min <= lower and upper <= info.max:
+            return np.dtype(dtype)
+    raise ValueError(f"No integer dtype holds the range [{lower}, {upper}]")
+
 
 class IntegerPool(GenePool):
     """A gene pool of constant length genomes only containing integers
@@ -72,6 +101,12 @@ class IntegerPool(GenePool):
         shape (int): The number of genes in a genome.
         lower (int): The smallest integer one gene can be.
         upper (int): The largest integer one gene can be.
+        dtype (DTypeLike, optional): The integer data type of created
+            genomes. If set to None, the smallest integer type that
+            holds ``lower`` and ``upper`` is chosen, e.g. ``np.uint8``
+            for genes between 0 and 100, which saves memory for large
+            populations. Note that arithmetic on genes of such a type
+            wraps around on overflow. Defaults to ``np.int64``.
     """
 
     def __init__(
@@ -79,18 +114,42 @@ class IntegerPool(GenePool):
         shape: int,
         lower: int,
         upper: int,
+        dtype: Optional[DTypeLike] = np.int64,
     ):
         super().__init__(typing=(GeneType.ORDINAL, GeneType.CONST_SIZE))
+        if dtype is None:
+            dtype = _narrow_dtype(lower, upper)
+        self._dtype: np.dtype[Any] = np.dtype(dtype)
+        if not np.issubdtype(self._dtype, np.integer):
+            raise ValueError(f"Expected an integer dtype, got {self._dtype}")
+        info = np.iinfo(self._dtype)
+        if lower < info.min or upper > info.max:
+            raise ValueError(f"Range [{lower}, {upper}] does not fit into "
+                             f"dtype {self._dtype}")
         self.lower = lower
         self.upper = upper
         self._shape = shape
         self._size = upper - lower + 1
 
+    @property
+    def dtype(self) -> np.dtype:
+        """The data type of genomes created by this pool."""
+        return self._dtype
+
     def random_genome(self, **kwargs) -> np.ndarray:
-        return np.random.randint(
+        return get_generator().integers(
+            self.lower,
+            self.upper + 1,
+            size=self._shape,
+            dtype=self._dtype,
+        )
+
+    def random_genomes(self, n: int, **kwargs) -> np.ndarray:
+        return get_generator().integers(
             self.lower,
             self.upper + 1,
-            size=self._shape
+            size=(n, self._shape),
+            dtype=self._dtype,
         )
 
 
@@ -118,7 +177,14 @@ class NumberPool(GenePool):
     def random_genome(self, **kwargs) -> np.ndarray:
         return (
             (self.upper - self.lower)
-            * np.random.random_sample(size=self._shape)
+            * get_generator().random(size=self._shape)
+            + self.lower
+        )
+
+    def random_genomes(self, n: int, **kwargs) -> np.ndarray:
+        return (
+            (self.upper - self.lower)
+            * get_generator().random(size=(n, self._shape))
             + self.lower
         )
 
@@ -189,13 +255,14 @@ class GPPool(GenePool):
         return self._max_depth
 
     def random_genome(self, **kwargs) -> np.ndarray:
+        rng = get_generator()
         rtype = kwargs.get(
             "rtype",
-            np.random.choice(np.array(list(self._elementary.keys()))),
+            rng.choice(np.array(list(self._elementary.keys()))),
         )
         height = kwargs.get(
             "height",
-            np.random.randint(self._min_depth, self._max_depth),
+            rng.integers(self._min_depth, self._max_depth),
         )
         stack: list[tuple[int, type]] = [(0, rtype)]
         genes = []
@@ -206,14 +273,14 @@ class GPPool(GenePool):
                     raise IndexError("Failed to create a GP-based genome; "
                                      f"A terminal allele of type {rtype} "
                                      "is requested but not found.")
-                terminal = np.random.choice(np.array(self._terminal[rtype]))
+                terminal = rng.choice(np.array(self._terminal[rtype]))
                 genes.append(terminal)
             else:
                 if rtype not in self._elementary:
                     raise IndexError("Failed to create a GP-based genom; "
                                      f"An elementary allele of type {rtype} "
                                      "is requested but not found.")
-                elementary = np.random.choice(
+                elementary = rng.choice(
                     np.array(self._elementary[rtype])
                 )
                 requested_types = elementary.__dict__["argtypes"]
@@ -13,6 +13,15 @@ class Individual:
     Args:
         genes (np.ndarray): The genome of the individual as a numpy
             array containing all genes.
+
+    Attributes:
+        dirty (bool): True if the fitness of the individual does not
+            belong to its current genes. It is cleared when the
+            individual is evaluated and an
+            :class:`~peal.core.environment.Environment` only evaluates
+            dirty individuals. Copies created by :meth:`copy` are always
+            dirty. Operators that change the genes of other individuals
+            in place have to set this flag.
     """
 
     genes: np.ndarray
@@ -22,9 +31,34 @@ class Individual:
         init=False,
         repr=False,
     )
+    dirty: bool = field(default=True, init=False, compare=False, repr=False)
+
+    @classmethod
+    def from_views(
+        cls,
+        genes: np.ndarray,
+        hidden_genes: np.ndarray,
+    ) -> "Individual":
+        """Creates an individual that uses the given arrays as genes and
+        hidden genes without copying them. This is used to create many
+        individuals whose genes are rows of a shared gene matrix.
+
+        Args:
+            genes (np.ndarray): The genome of the individual.
+            hidden_genes (np.ndarray): The hidden genes of the
+                individual.
+        """
+        ind = cls.__new__(cls)
+        ind.genes = genes
+        ind.fitness = 0.0
+        ind.hidden_genes = hidden_genes
+        ind.dirty = True
+        return ind
 
     def copy(self) -> "Individual":
-        """Creates and returns a copy of this individual."""
+        """Creates and returns a copy of this individual. The copy is
+        marked as dirty, as its genes are usually changed afterwards.
+        """
         ind = Individual(self.genes.copy())
         ind.fitness = self.fitness
         ind.hidden_genes = self.hidden_genes.copy()
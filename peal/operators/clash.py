@@ -5,7 +5,7 @@ existing ones.
 import numpy as np
 
 from peal.community import Community
-from peal.operators.iteration import StraightIteration
+from peal.operators.iteration import FullIteration, StraightIteration
 from peal.operators.operator import Operator
 from peal.population import Population
 
@@ -34,22 +34,60 @@ class EquiMix(Operator):
         container: Community,
     ) -> Community:
         offspring_populations = Community()
-        population_parent_indices = [
-            np.random.randint(
-                0,
-                container.size,
-                size=self._group_size,
-            ) for _ in range(self._out_size)
-        ]
-        n_indivs = container[0].size
+        population_parent_indices = self.rng.integers(
+            0,
+            container.size,
+            size=(self._out_size, self._group_size),
+        ).tolist()
+        # number of individuals given by each population of a group,
+        # the first ones give one more if they cannot give the same
+        base, remainder = divmod(container[0].size, self._group_size)
+        parts = [base + 1] * remainder
+        parts += [base] * (self._group_size - remainder)
         for indices in population_parent_indices:
-            new_population = Population()
-            parts = [n_indivs // self._group_size
-                     for _ in range(self._group_size)]
-            for i in range(n_indivs % self._group_size):
-                parts[i % self._group_size] += 1
-            for i in indices:
-                for j in parts:
-                    new_population.integrate(container[i][0:j].deepcopy())
-            offspring_populations.integrate(new_population)
+            # the individuals of all parts are copied at once, so the new
+            # population keeps its genes in a single block
+            offspring_populations.integrate(Population(tuple(
+                ind
+                for i, j in zip(indices, parts)
+                for ind in container[i][0:j]
+            )).deepcopy())
         return offspring_populations
+
+
+class Migration(Operator):
+    """Operator that exchanges individuals between the populations of a
+    community which are arranged in a ring. Every population receives
+    copies of the best individuals of its predecessor, which replace its
+    worst individuals. This operator is used to connect otherwise
+    isolated populations, e.g. in an island model.
+
+    Args:
+        size (int, optional): The number of individuals that migrate
+            from each population. Defaults to 1.
+    """
+
+    def __init__(self, size: int = 1):
+        super().__init__(FullIteration())
+        if size < 1:
+            raise ValueError(f"Migration size has to be > 0, got {size}")
+        self._size = size
+
+    def _process_community(
+        self,
+        container: Community,
+    ) -> Community:
+        if container.size < 2:
+            return container
+        rankings = [np.argsort(pop.fitness) for pop in container]
+        migrants = [
+            [container[i][j].copy() for j in ranking[-self._size:]]
+            for i, ranking in enumerate(rankings)
+        ]
+        community = Community()
+        for i, population in enumerate(container):
+            population = population.copy()
+            for j, migrant in zip(rankings[i][:self._size], migrants[i-1]):
+                population[j] = migrant
+            community.integrate(population)
+        return community
@@ -92,18 +92,40 @@ class Crowded(Operator):
         offspring, parents = container
         merged = parents.copy()
 
-        for off in offspring:
-            compare = np.random.choice(
-                parents.size,
-                size=self._cf,
-                replace=False
-            )
-            best = compare[0]
-            best_distance = np.sum(parents[compare[0]].genes == off.genes)
-            for index in compare:
-                if ((dist := np.sum(parents[index].genes == off.genes))
-                        > best_distance):
-                    best_distance = dist
-                    best = index
-            merged[best] = off.copy()
+        if offspring.size == 0:
+            return Community(merged)
+        if self._cf > parents.size:
+            raise ValueError(f"Crowding factor {self._cf} is larger than "
+                             f"the parent population ({parents.size})")
+        rng = self.rng
+        if offspring.size * parents.size > 2**20:
+            compare = np.array([
+                rng.choice(parents.size, size=self._cf, replace=False)
+                for _ in range(offspring.size)
+            ]).reshape(offspring.size, self._cf)
+        else:
+            # for small populations, the candidates of each offspring
+            # are the first entries of an independent permutation
+            compare = rng.permuted(
+                np.broadcast_to(
+                    np.arange(parents.size),
+                    (offspring.size, parents.size),
+                ),
+                axis=1,
+            )[:, :self._cf]
+        # genes are compared over all gene axes, genomes may have more
+        # than one dimension
+        similarity = np.count_nonzero(
+            (parents.genes[compare]
+             == offspring.genes[:, np.newaxis]).reshape(
+                offspring.size, self._cf, -1,
+            ),
+            axis=2,
+        )
+        winners = compare[
+            np.arange(offspring.size),
+            np.argmax(similarity, axis=1),
+        ]
+        for off, winner in zip(offspring, winners):
+            merged[winner] = off.copy()
         return Community(merged)
@@ -9,6 +9,7 @@ import numpy as np
 
 from peal.community import Community
 from peal.population import Population
+from peal.rng import get_generator
 
 
 class IterationType(ABC):
@@ -59,6 +60,20 @@ class SingleIteration(IterationType):
             yield container[i:i+1]
 
 
+class FullIteration(IterationType):
+    """Class that returns the whole container in a single iteration.
+    Operators using this iteration type are able to process all
+    individuals or populations at once.
+    """
+
+    def _iterate(
+        self,
+        container: Union[Population, Community],
+    ) -> Iterator[Union[Population, Community]]:
+        if container.size > 0:
+            yield container
+
+
 class RandomSingleIteration(IterationType):
     """Class that iterates over single individuals in a population the
     same order they appear.
@@ -75,8 +90,9 @@ class RandomSingleIteration(IterationType):
         self,
         container: Union[Population, Community],
     ) -> Iterator[Union[Population, Community]]:
+        rng = get_generator()
         for i in range(container.size):
-            if np.random.random_sample() <= self._probability:
+            if rng.random() <= self._probability:
                 yield container[i:i+1]
 
 
@@ -97,6 +113,11 @@ class StraightIteration(IterationType):
         self,
         container: Union[Population, Community],
     ) -> Iterator[Union[Population, Community]]:
+        if 0 < container.size <= self._batch_size:
+            # a single batch does not need to be copied, e.g. the pair
+            # of offspring and parents given to an integration
+            yield container
+            return
         for i in range(0, container.size, self._batch_size):
             yield container[i:i+self._batch_size]
 
@@ -120,8 +141,9 @@ class RandomStraightIteration(IterationType):
         self,
         container: Union[Population, Community],
     ) -> Iterator[Union[Population, Community]]:
+        rng = get_generator()
         for i in range(0, container.size, self._batch_size):
-            if np.random.random_sample() <= self._probability:
+            if rng.random() <= self._probability:
                 yield container[i:i+self._batch_size]
 
 
@@ -148,10 +170,26 @@ class NRandomBatchesIteration(IterationType):
         container: Union[Population, Community],
     ) -> Iterator[Union[Population, Community]]:
         total = self._total if self._total is not None else container.size
-        for _ in range(total):
-            indices = np.random.choice(
-                container.size,
-                size=self._batch_size,
-                replace=False,
-            )
-            yield container[list(indices)]
+        if self._batch_size > container.size:
+            raise ValueError(f"Cannot draw batches of size {self._batch_size}"
+                             f" from a container of size {container.size}")
+        rng = get_generator()
+        if total * container.size > 2**20:
+            for _ in range(total):
+                yield container[rng.choice(
+                    container.size,
+                    size=self._batch_size,
+                    replace=False,
+                ).tolist()]
+            return
+        # for small containers, all batches are drawn at once as the
+        # first entries of independent permutations
+        batches = rng.permuted(
+            np.broadcast_to(
+                np.arange(container.size),
+                (total, container.size),
+            ),
+            axis=1,
+        )[:, :self._batch_size].tolist()
+        for indices in batches:
+            yield container[indices]
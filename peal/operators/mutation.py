@@ -1,17 +1,52 @@
 """Module that defines operators that mutate individuals or populations.
 """
 
+from abc import ABC, abstractmethod
 from typing import Optional
 import numpy as np
 
 from peal.genetics import GPPool, GPTerminal
+from peal.operators.iteration import FullIteration
 from peal.operators.operator import Operator
 from peal.population import Population
 
 
-class BitFlip(Operator):
+class MatrixMutation(Operator, ABC):
+    """Base class for mutations that change the gene matrix of a whole
+    population at once. This requires genomes of the same length.
+    Inheriting classes implement :meth:`MatrixMutation.mutate`, which
+    can also be applied by an
+    :class:`~peal.core.environment.Environment` directly to the genes
+    created by a :class:`~peal.operators.reproduction.Crossover`,
+    without building the intermediate offspring population.
+    """
+
+    def __init__(self):
+        super().__init__(iter_type=FullIteration())
+
+    def _process_population(
+        self,
+        container: Population,
+    ) -> Population:
+        return self.mutate(container, container.genes)
+
+    @abstractmethod
+    def mutate(self, population: Population, genes: np.ndarray) -> Population:
+        """Mutates the given gene matrix in place and returns a copy of
+        the population whose individuals have the mutated rows as genes.
+
+        Args:
+            population (Population): The population the genes are given
+                to, e.g. for reading hidden genes.
+            genes (np.ndarray): A writable gene matrix with one row for
+                each individual in the population.
+        """
+
+
+class BitFlip(MatrixMutation):
     """Mutation that applies the python ``not`` operator to genes in
-    an individual.
+    an individual. All individuals of a population are mutated at once.
+    This requires genomes of the same length.
 
     Args:
         prob (float, optional): The probability of each gene to mutate.
@@ -22,20 +57,18 @@ class BitFlip(Operator):
         super().__init__()
         self._prob = prob
 
-    def _process_population(
-        self,
-        container: Population,
-    ) -> Population:
-        ind = container[0].copy()
-        for i, gene in enumerate(ind.genes):
-            if np.random.random_sample() <= self._prob:
-                ind.genes[i] = not gene
-        return Population(ind)
+    def mutate(self, population: Population, genes: np.ndarray) -> Population:
+        hits = self.rng.random(genes.shape) <= self._prob
+        genes[hits] = np.logical_not(genes[hits])
+        return population.with_genes(genes)
 
 
-class UniformInt(Operator):
+class UniformInt(MatrixMutation):
     """Mutation that selects a random uniformly distributed integer from
     a given range with a certain probability for a single gene.
+    All individuals of a population are mutated at once. This requires
+    genomes of the same length. New integers are drawn in the data type
+    of the genes, so the given range has to fit into this type.
 
     Args:
         prob (float, optional): The probability of each gene to mutate.
@@ -57,25 +90,25 @@ class UniformInt(Operator):
         self._lowest = lowest
         self._highest = highest
 
-    def _process_population(
-        self,
-        container: Population,
-    ) -> Population:
-        ind = container[0].copy()
-        hits = np.where(
-            np.random.random_sample(len(ind.genes)) <= self._prob
-        )[0]
-        ind.genes[hits] = np.random.randint(
+    def mutate(self, population: Population, genes: np.ndarray) -> Population:
+        rng = self.rng
+        hits = rng.random(genes.shape) <= self._prob
+        genes[hits] = rng.integers(
             self._lowest,
             self._highest+1,
-            size=len(hits),
+            size=np.count_nonzero(hits),
+            dtype=(
+                genes.dtype if np.issubdtype(genes.dtype, np.integer)
+                else np.int64
+            ),
         )
-        return Population(ind)
+        return population.with_genes(genes)
 
 
-class UniformFloat(Operator):
+class UniformFloat(MatrixMutation):
     """Mutation that mutates a gene to a random float in a given range
-    with certain probability.
+    with certain probability. All individuals of a population are
+    mutated at once. This requires genomes of the same length.
 
     Args:
         prob (float, optional): The probability of each gene to mutate.
@@ -97,25 +130,22 @@ class UniformFloat(Operator):
         self._lowest = lowest
         self._highest = highest
 
-    def _process_population(
-        self,
-        container: Population,
-    ) -> Population:
-        ind = container[0].copy()
-        hits = np.where(
-            np.random.random_sample(len(ind.genes)) <= self._prob
-        )[0]
-        ind.genes[hits] = (
+    def mutate(self, population: Population, genes: np.ndarray) -> Population:
+        rng = self.rng
+        hits = rng.random(genes.shape) <= self._prob
+        genes[hits] = (
             (self._highest-self._lowest)
-            * np.random.random_sample(size=len(hits))
+            * rng.random(size=np.count_nonzero(hits))
             + self._lowest
         )
-        return Population(ind)
+        return population.with_genes(genes)
 
 
-class NormalDist(Operator):
+class NormalDist(MatrixMutation):
     """Mutation operator that changes genes for an individual with a
-    probability by __adding__ a randomly distributed real value.
+    probability by __adding__ a randomly distributed real value. All
+    individuals of a population are mutated at once. This requires
+    genomes of the same length.
 
     Args:
         prob (float, optional): The probability of each gene to mutate.
@@ -146,26 +176,29 @@ class NormalDist(Operator):
         self._sigma = sigma
         self._alpha = alpha
 
-    def _process_population(
-        self,
-        container: Population,
-    ) -> Population:
-        ind = container[0].copy()
-        hits = np.where(
-            np.random.random_sample(len(ind.genes)) <= self._prob
-        )[0]
-        sigma = self._sigma
-        if self._alpha is not None:
-            sigma = ind.hidden_genes[0]
-            ind.hidden_genes[0] *= np.random.choice(
-                [self._alpha, 1/self._alpha]
+    def mutate(self, population: Population, genes: np.ndarray) -> Population:
+        rng = self.rng
+        hits = rng.random(genes.shape) <= self._prob
+        if self._alpha is None:
+            genes[hits] += rng.normal(
+                self._mu,
+                self._sigma,
+                size=np.count_nonzero(hits),
             )
-        ind.genes[hits] += np.random.normal(
+            return population.with_genes(genes)
+        sigma = np.array([ind.hidden_genes[0] for ind in population])
+        factors = rng.choice(
+            [self._alpha, 1/self._alpha],
+            size=population.size,
+        )
+        genes[hits] += rng.normal(
             self._mu,
-            sigma,
-            size=len(hits),
+            np.broadcast_to(sigma[:, np.newaxis], genes.shape)[hits],
         )
-        return Population(ind)
+        offspring = population.with_genes(genes)
+        for ind, factor in zip(offspring, factors):
+            ind.hidden_genes[0] *= factor
+        return offspring
 
 
 class GPPoint(Operator):
@@ -200,11 +233,12 @@ class GPPoint(Operator):
         self,
         container: Population,
     ) -> Population:
-        if np.random.random_sample() >= self._prob:
+        rng = self.rng
+        if rng.random() >= self._prob:
             return container.deepcopy()
 
         ind = container[0].copy()
-        index = np.random.randint(0, len(ind.genes))
+        index = rng.integers(0, len(ind.genes))
         # search for subtree slice starting at index in the tree
         right = index + 1
         total = 0
@@ -220,7 +254,7 @@ class GPPoint(Operator):
             ind.genes[:index],
             self._pool.random_genome(
                 rtype=ind.genes[index].rtype,
-                height=np.random.randint(self._min_height, self._max_height+1),
+                height=rng.integers(self._min_height, self._max_height+1),
             ),
             ind.genes[right:],
         ))
@@ -3,9 +3,12 @@
 from typing import Optional, Union, overload
 import warnings
 
+import numpy as np
+
 from peal.community import Community
 from peal.operators.iteration import IterationType, SingleIteration
 from peal.population import Population
+from peal.rng import get_generator
 
 
 class Operator:
@@ -33,6 +36,7 @@ class Operator:
         iter_type: Optional[IterationType] = None,
     ):
         self._iter_type = SingleIteration() if iter_type is None else iter_type
+        self._rng: Optional[np.random.Generator] = None
 
     @property
     def iter_type(self) -> IterationType:
@@ -50,6 +54,22 @@ class Operator:
             raise TypeError(f"Expected IterationType, got {type(iter_type)}")
         self._iter_type = iter_type
 
+    @property
+    def rng(self) -> np.random.Generator:
+        """The random number generator used by this operator. If no
+        generator is set, the global generator from :mod:`peal.rng` is
+        used. Setting an own generator gives the operator an independent
+        stream of random numbers, e.g. for reproducible operators in
+        concurrently evolved populations.
+        """
+        return get_generator() if self._rng is None else self._rng
+
+    @rng.setter
+    def rng(self, rng: Optional[np.random.Generator]) -> None:
+        if rng is not None and not isinstance(rng, np.random.Generator):
+            raise TypeError(f"Expected Generator, got {type(rng)}")
+        self._rng = rng
+
     @overload
     def process(
         self,
@@ -70,14 +90,26 @@ class Operator:
     ) -> Union[Population, Community]:
         """Processes and returns the given population or community."""
         if isinstance(container, Population):
+            populations = [
+                self._process_population(batch)
+                for batch in self._iter_type(container)
+            ]
+            if len(populations) == 1:
+                return populations[0]
             population = Population()
-            for batch in self._iter_type(container):
-                population.integrate(self._process_population(batch))
+            for processed in populations:
+                population.integrate(processed)
             return population
         if isinstance(container, Community):
+            communities = [
+                self._process_community(population_batch)
+                for population_batch in self._iter_type(container)
+            ]
+            if len(communities) == 1:
+                return communities[0]
             community = Community()
-            for population_batch in self._iter_type(container):
-                community.integrate(self._process_community(population_batch))
+            for processed_community in communities:
+                community.integrate(processed_community)
             return community
         raise TypeError("Operator can only process populations or communities")
 
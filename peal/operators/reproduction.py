@@ -1,9 +1,12 @@
 """Module that provides operators that reproduce individuals."""
 
+from typing import Optional
+
 import numpy as np
 
 from peal.community import Community
 from peal.operators.iteration import (
+    FullIteration,
     SingleIteration,
     RandomStraightIteration,
 )
@@ -32,8 +35,40 @@ class Copy(Operator):
         return container.deepcopy()
 
 
+class RandomCopy(Operator):
+    """Reproduction operator that copies randomly chosen individuals of
+    a population. All individuals are drawn at once and with
+    replacement.
+
+    Args:
+        total (int, optional): The number of copies to create. If set to
+            None, the number of copies is equal to the size of the input
+            population. Defaults to None.
+    """
+
+    def __init__(self, total: Optional[int] = None):
+        super().__init__(iter_type=FullIteration())
+        self._total = total
+
+    def _process_population(
+        self,
+        container: Population,
+    ) -> Population:
+        chosen = self.rng.integers(
+            0,
+            container.size,
+            size=container.size if self._total is None else self._total,
+            dtype=np.intp,
+        )
+        return container[chosen].deepcopy()
+
+
 class Crossover(Operator):
-    """Crossover reproduction operator.
+    """Crossover reproduction operator. Consecutive individuals in a
+    population are paired and each pair is crossed over with a given
+    probability. Only the offspring of pairs that performed the
+    crossover are returned. All pairs are processed at once which
+    requires genomes of the same length.
 
     Args:
         npoints (int, optional): The number of points to use for the
@@ -43,37 +78,58 @@ class Crossover(Operator):
     """
 
     def __init__(self, npoints: int = 2, probability: float = 0.5):
-        super().__init__(
-            RandomStraightIteration(batch_size=2, probability=probability)
-        )
+        super().__init__(iter_type=FullIteration())
         self._npoints = npoints
+        self._probability = probability
 
     def _process_population(
         self,
         container: Population,
     ) -> Population:
-        ind1, ind2 = container
-        points = np.insert(
-            np.sort(
-                np.random.randint(
-                    1,
-                    len(ind1.genes),
-                    size=self._npoints
-                )
-            ),
-            [0, -1],
-            [0, len(ind1.genes)]
-        )
-        start = self._npoints % 2
-        off1, off2 = ind1.copy(), ind2.copy()
-        for i in range(start, self._npoints+(1-start), 2):
-            off1.genes[points[i]:points[i+1]] = ind2.genes[
-                points[i]:points[i+1]
-            ]
-            off2.genes[points[i]:points[i+1]] = ind1.genes[
-                points[i]:points[i+1]
-            ]
-        return Population((off1, off2))
+        parents, offspring = self.cross(container)
+        if parents.size == 0:
+            return Population()
+        return parents.with_genes(offspring)
+
+    def cross(self, population: Population) -> tuple[Population, np.ndarray]:
+        """Performs the crossover on the given population without
+        creating new individuals.
+
+        Args:
+            population (Population): The population to reproduce.
+
+        Returns:
+            tuple[Population, np.ndarray]: The parent of each offspring
+            in the order of the offspring and the gene matrix of the
+            offspring with one row for each parent.
+        """
+        rng = self.rng
+        pairs = np.where(
+            rng.random(population.size // 2) <= self._probability
+        )[0]
+        if pairs.size == 0:
+            return Population(), np.empty((0, 0))
+        genes = population.genes
+        length = genes.shape[1]
+        first = genes[2*pairs]
+        second = genes[2*pairs+1]
+        points = rng.integers(1, length, size=(pairs.size, self._npoints))
+        if self._npoints == 1:
+            swap = np.arange(length) >= points
+        else:
+            # a gene is swapped if it lies in a segment with the same
+            # parity as the number of points, i.e. the last segment is
+            # always swapped
+            segment = np.sum(
+                points[:, :, np.newaxis] <= np.arange(length),
+                axis=1,
+            )
+            swap = segment % 2 == self._npoints % 2
+        offspring = np.empty((2*pairs.size, length), dtype=genes.dtype)
+        offspring[0::2] = np.where(swap, second, first)
+        offspring[1::2] = np.where(swap, first, second)
+        parents = np.stack((2*pairs, 2*pairs+1), axis=1).ravel()
+        return population[parents], offspring
 
 
 class DiscreteRecombination(Operator):
@@ -106,24 +162,12 @@ class DiscreteRecombination(Operator):
         if container.size == 1:
             return container.deepcopy()
 
-        parts = [
-            container[0].genes.shape[0] // container.size
-            for _ in range(container.size)
-        ]
-        missing = container[0].genes.shape[0] % container.size
-        for i in range(missing):
-            parts[i] += 1
-        parts.insert(0, 0)
-
-        genes = np.zeros_like(container[0].genes)
-        shuffled_indices = np.arange(container[0].genes.shape[0])
-        np.random.shuffle(shuffled_indices)
-        for i in range(len(parts)-1):
-            genes[shuffled_indices[parts[i]:parts[i]+parts[i+1]]] = (
-                container[i].genes[
-                    shuffled_indices[parts[i]:parts[i]+parts[i+1]]
-                ]
-            )
-        new_ind = container[0].copy()
-        new_ind.genes = genes
-        return Population(new_ind)
+        # every individual owns a random subset of the loci, the first
+        # length % size individuals own one locus more than the others
+        length = container[0].genes.shape[0]
+        owner = np.empty(length, dtype=np.intp)
+        owner[self.rng.permutation(length)] = (
+            np.arange(length) % container.size
+        )
+        genes = container.genes[owner, np.arange(length)]
+        return container[0:1].with_genes(genes[np.newaxis])
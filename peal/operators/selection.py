@@ -5,14 +5,17 @@ population or populations from a community.
 import numpy as np
 
 from peal.community import Community
-from peal.operators.iteration import NRandomBatchesIteration, StraightIteration
+from peal.operators.iteration import FullIteration, StraightIteration
 from peal.operators.operator import Operator
 from peal.population import Population
 
 
 class Tournament(Operator):
     """A selection operator that simulates a tournament selection of
-    variable size for multiple individuals in a population.
+    variable size for multiple individuals in a population. As many
+    tournaments as there are individuals in the population are held at
+    once. The participants of each tournament are drawn with
+    replacement.
 
     Args:
         size (int, optional): The number of individuals participating in
@@ -20,13 +23,32 @@ class Tournament(Operator):
     """
 
     def __init__(self, size: int = 2):
-        super().__init__(iter_type=NRandomBatchesIteration(batch_size=size))
+        super().__init__(iter_type=FullIteration())
+        self._size = size
 
     def _process_population(
         self,
         container: Population,
     ) -> Population:
-        return Population(max(container, key=lambda x: x.fitness).copy())
+        participants = self.rng.integers(
+            0,
+            container.size,
+            size=(container.size, self._size),
+            dtype=np.intp,
+        )
+        fitness = container.fitness[participants]
+        if self._size == 2:
+            winners = np.where(
+                fitness[:, 0] >= fitness[:, 1],
+                participants[:, 0],
+                participants[:, 1],
+            )
+        else:
+            winners = participants[
+                np.arange(container.size),
+                np.argmax(fitness, axis=1),
+            ]
+        return container[winners]._final_copy()
 
 
 class Best(Operator):
@@ -44,11 +66,9 @@ class Best(Operator):
         self,
         container: Population,
     ) -> Population:
-        return Population([ind.copy() for ind in sorted(
-            container,
-            key=lambda x: x.fitness,
-            reverse=True,
-        )[:self._out_size]])
+        # a stable sort keeps individuals of equal fitness in order
+        best = np.argsort(-container.fitness, kind="stable")
+        return container[best[:self._out_size]]._final_copy()
 
 
 class BestMean(Operator):
@@ -68,8 +88,8 @@ class BestMean(Operator):
         self,
         container: Community,
     ) -> Community:
-        return Community([pop.deepcopy() for pop in sorted(
-            container,
-            key=lambda pop: np.mean(pop.fitness),
-            reverse=True,
-        )[:self._out_size]])
+        means = np.array([np.mean(pop.fitness) for pop in container])
+        best = np.argsort(-means, kind="stable")[:self._out_size]
+        return Community([
+            container[i]._final_copy() for i in best.tolist()
+        ])
@@ -1,4 +1,12 @@
-from typing import Iterable, Optional, Sequence, SupportsIndex, Union, overload
+from typing import (
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    SupportsIndex,
+    Union,
+    overload,
+)
 
 import numpy as np
 
@@ -9,6 +17,13 @@ class Population:
     """An iterable container for :class:`~peal.individual.Individual`
     objects.
 
+    Populations created by :meth:`Population.from_genes` (e.g. initial
+    populations and the output of whole population operators) keep the
+    genomes of their individuals in one contiguous gene matrix. The
+    individuals only hold views of its rows, so :attr:`genes` can be
+    served without stacking single genomes. The individuals themselves
+    stay independent objects that can be shared between populations.
+
     Args:
         individuals (Individual | Iterable[Individual]): One or more
             individuals to add.
@@ -18,8 +33,10 @@ class Population:
         self,
         individuals: Optional[Union[Individual, Iterable[Individual]]] = None,
     ):
-        self._iter_id = -1
         self._individuals: list[Individual] = []
+        # contiguous gene matrix the individuals were created from
+        self._block: Optional[np.ndarray] = None
+        self._rows: tuple[np.ndarray, ...] = ()
         if individuals is not None:
             self.integrate(individuals)
 
@@ -29,19 +46,65 @@ class Population:
         return len(self._individuals)
 
     @property
-    def fitness(self) -> list[float]:
+    def fitness(self) -> np.ndarray:
         """Returns the fitness of all individuals in the population as
-        a list of floats.
+        a one dimensional numpy array of floats.
         """
-        return [ind.fitness for ind in self._individuals]
+        return np.fromiter(
+            (ind.fitness for ind in self._individuals),
+            dtype=float,
+            count=len(self._individuals),
+        )
 
     @property
     def genes(self) -> np.ndarray:
         """Returns the genes of all individuals in the population as
         a multidimensional numpy array.
         """
+        if self._block is not None and all(
+            ind.genes is row
+            for ind, row in zip(self._individuals, self._rows)
+        ):
+            return self._block.copy()
         return np.array([ind.genes for ind in self._individuals])
 
+    @classmethod
+    def from_genes(
+        cls,
+        genes: np.ndarray,
+        hidden_genes: Optional[np.ndarray] = None,
+    ) -> "Population":
+        """Creates a population out of a gene matrix. Each row of the
+        matrix is the genome of one new individual. All genomes are
+        stored in one contiguous block of memory and the individuals
+        only hold views of their corresponding row.
+
+        Args:
+            genes (np.ndarray): A numpy array of at least two dimensions
+                with one genome in each row.
+            hidden_genes (np.ndarray, optional): A numpy array with the
+                hidden genes of each individual in a row. If set to
+                None, all hidden genes are initialized with ones.
+                Defaults to None.
+        """
+        genes = np.ascontiguousarray(genes)
+        if genes.ndim < 2:
+            raise ValueError("Expected an array with at least two "
+                             f"dimensions, got {genes.ndim}")
+        if hidden_genes is None:
+            hidden_genes = np.ones((len(genes), 1), dtype=np.float32)
+        elif len(hidden_genes) != len(genes):
+            raise ValueError(f"Expected {len(genes)} hidden genomes, "
+                             f"got {len(hidden_genes)}")
+        population = cls()
+        population._individuals = [
+            Individual.from_views(row, hidden)
+            for row, hidden in zip(genes, hidden_genes)
+        ]
+        population._block = genes
+        population._rows = tuple(ind.genes for ind in population)
+        return population
+
     def integrate(
         self,
         individuals: Union[Individual, Iterable[Individual]],
@@ -52,6 +115,7 @@ class Population:
             individuals (Individual | Iterable[Individual]): One or
                 multiple individuals to fill this population with.
         """
+        self._block = None
         if isinstance(individuals, Individual):
             self._individuals.append(individuals)
         elif isinstance(individuals, Iterable):
@@ -64,6 +128,47 @@ class Population:
             raise TypeError("Can only append individuals to a population, "
                             f"got {type(individuals)}")
 
+    def with_genes(self, genes: np.ndarray) -> "Population":
+        """Returns a deep copy of this population where the genes of
+        all individuals are replaced by the rows of the given gene
+        matrix. The new genes are stored as in
+        :meth:`Population.from_genes`. Individuals with unchanged genes
+        are not marked as dirty, so the given genes should be final.
+
+        Args:
+            genes (np.ndarray): A numpy array with one genome for each
+                individual in this population.
+        """
+        if len(genes) != self.size:
+            raise ValueError(f"Expected {self.size} genomes, "
+                             f"got {len(genes)}")
+        # this array becomes the gene block of the new population
+        genes = np.ascontiguousarray(genes)
+        hidden = [ind.hidden_genes for ind in self._individuals]
+        if len({h.shape for h in hidden}) == 1:
+            population = Population.from_genes(genes, np.array(hidden))
+        else:
+            population = Population.from_genes(genes)
+            for new, old_hidden in zip(population._individuals, hidden):
+                new.hidden_genes = old_hidden.copy()
+        # individuals keep their fitness and are only marked as dirty
+        # if their genes changed
+        if all(ind.genes.shape == genes.shape[1:]
+               for ind in self._individuals):
+            changed = (self.genes != genes).reshape(
+                self.size, -1,
+            ).any(axis=1).tolist()
+        else:
+            changed = [True] * self.size
+        for new, old, change in zip(
+            population._individuals,
+            self._individuals,
+            changed,
+        ):
+            new.fitness = old.fitness
+            new.dirty = old.dirty or change
+        return population
+
     def summary(self, max_lines: int = 4) -> str:
         """Returns a summary of the population as a string.
 
@@ -93,41 +198,74 @@ class Population:
 
     def deepcopy(self) -> "Population":
         """Returns a deep copy of this population that is also copying
-        the individuals.
+        the individuals. Genomes of equal shape are copied into one
+        new gene matrix as in :meth:`Population.from_genes`. As for
+        :meth:`Individual.copy`, all copied individuals are marked as
+        dirty.
         """
-        return Population(tuple(indiv.copy() for indiv in self._individuals))
+        population = self._final_copy()
+        for ind in population:
+            ind.dirty = True
+        return population
 
-    def __iter__(self) -> "Population":
-        self._iter_id = -1
-        return self
+    def _final_copy(self) -> "Population":
+        # deep copy for operators like selections whose output genes are
+        # final, individuals are only dirty if their originals are
+        genes = [ind.genes for ind in self._individuals]
+        if (len({(g.shape, g.dtype) for g in genes}) == 1
+                and genes[0].dtype != object):
+            return self.with_genes(np.array(genes))
+        copies = tuple(ind.copy() for ind in self._individuals)
+        for copy, ind in zip(copies, self._individuals):
+            copy.dirty = ind.dirty
+        return Population(copies)
 
-    def __next__(self) -> Individual:
-        if self._iter_id == len(self._individuals) - 1:
-            raise StopIteration
-        self._iter_id += 1
-        return self._individuals[self._iter_id]
+    def __iter__(self) -> Iterator[Individual]:
+        return iter(self._individuals)
 
-    @overload
-    def __getitem__(self, key: SupportsIndex) -> Individual:
-        ...
+    def __len__(self) -> int:
+        return len(self._individuals)
 
     @overload
-    def __getitem__(self, key: slice) -> "Population":
+    def __getitem__(self, key: Union[int, np.integer]) -> Individual:
         ...
 
     @overload
-    def __getitem__(self, key: Sequence[int]) -> "Population":
+    def __getitem__(
+        self,
+        key: Union[slice, Sequence[int], np.ndarray],
+    ) -> "Population":
         ...
 
     def __getitem__(
         self,
-        key: Union[SupportsIndex, slice, Sequence[int]],
+        key: Union[int, np.integer, slice, Sequence[int], np.ndarray],
     ) -> Union["Population", Individual]:
+        if isinstance(key, (int, np.integer)):
+            return self._individuals[key]
         if isinstance(key, slice):
-            return Population(self._individuals[key])
+            return self._from_list(self._individuals[key])
+        if isinstance(key, np.ndarray):
+            # boolean arrays are masks as for numpy arrays
+            if key.dtype == bool:
+                if key.shape != (self.size, ):
+                    raise IndexError(f"Expected a mask of {self.size} "
+                                     f"booleans, got shape {key.shape}")
+                key = np.flatnonzero(key)
+            key = key.tolist()
         if isinstance(key, Sequence):
-            return Population([self._individuals[i] for i in key])
-        return self._individuals.__getitem__(key)
+            return self._from_list(
+                list(map(self._individuals.__getitem__, key))
+            )
+        raise TypeError(f"Invalid index of type {type(key)}")
+
+    @classmethod
+    def _from_list(cls, individuals: list[Individual]) -> "Population":
+        # creates a population out of individuals taken from another
+        # population without checking their type again
+        population = cls()
+        population._individuals = individuals
+        return population
 
     @overload
     def __setitem__(self, key: SupportsIndex, value: Individual) -> None:
@@ -138,6 +276,7 @@ class Population:
         ...
 
     def __setitem__(self, key, value) -> None:
+        self._block = None
         self._individuals.__setitem__(key, value)
 
     def __str__(self) -> str:
@@ -0,0 +1,75 @@
+"""Module that provides the random number generator used by all gene
+pools and operators in peal.
+"""
+
+from contextlib import contextmanager
+import threading
+from typing import Iterator, Optional
+
+import numpy as np
+
+_GENERATOR = np.random.Generator(np.random.PCG64DXSM())
+_LOCAL = threading.local()
+
+
+def get_generator() -> np.random.Generator:
+    """Returns the random number generator that is currently used in
+    peal. This is the generator set by :meth:`local_generator` for the
+    current thread or else the global one.
+    """
+    generator = getattr(_LOCAL, "generator", None)
+    return _GENERATOR if generator is None else generator
+
+
+def spawn_generators(n: int) -> list[np.random.Generator]:
+    """Creates independent random number generators whose seeds are
+    drawn from the generator returned by :meth:`get_generator`. They
+    use the same type of bit generator.
+
+    Args:
+        n (int): The number of generators to create.
+    """
+    generator = get_generator()
+    entropy = generator.integers(2**63, size=4).tolist()
+    bit_generator = type(generator.bit_generator)
+    return [
+        np.random.Generator(bit_generator(seed_))
+        for seed_ in np.random.SeedSequence(entropy).spawn(n)
+    ]
+
+
+@contextmanager
+def local_generator(generator: np.random.Generator) -> Iterator[None]:
+    """Context manager that replaces the global random number generator
+    by the given one in the current thread. This gives concurrently
+    evolved populations independent and reproducible random numbers.
+
+    Args:
+        generator (np.random.Generator): The generator to use inside
+            the context.
+    """
+    previous = getattr(_LOCAL, "generator", None)
+    _LOCAL.generator = generator
+    try:
+        yield
+    finally:
+        _LOCAL.generator = previous
+
+
+def seed(
+    seed_: Optional[int] = None,
+    bit_generator: type[np.random.BitGenerator] = np.random.PCG64DXSM,
+) -> None:
+    """Replaces the global random number generator used in peal by a
+    new one. This allows reproducible evolutionary processes.
+
+    Args:
+        seed_ (int, optional): The seed of the new generator. If set to
+            None, fresh entropy is pulled from the operating system.
+            Defaults to None.
+        bit_generator (type, optional): The type of bit generator to
+            use, e.g. ``np.random.SFC64`` for faster sampling.
+            Defaults to ``np.random.PCG64DXSM``.
+    """
+    global _GENERATOR
+    _GENERATOR = np.random.Generator(bit_generator(seed_))
@@ -35,3 +35,19 @@ def test_bestworst():
     assert tracker.worst[0] is indiv1
     assert tracker.worst[1] is indiv1
     assert tracker.worst[2] is indiv2
+
+
+def test_diversity():
+    pool = peal.genetics.IntegerPool(shape=4, lower=0, upper=5)
+    statistics = peal.callback.Diversity(pool=pool)
+    genes = np.array([
+        [0, 1, 2, 5],
+        [0, 1, 3, 4],
+        [0, 2, 4, 3],
+        [0, 2, 5, 2],
+    ])
+
+    statistics.on_start(peal.Population.from_genes(genes))
+    statistics.on_generation_end(peal.Population.from_genes(genes))
+
+    assert np.allclose(statistics.gene_diversity, [[0, .5, .75, .75]])
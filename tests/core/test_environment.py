@@ -0,0 +1,175 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+import peal
+
+
+def test_reproducible_islands():
+    strategy = peal.core.Strategy(
+        init_individuals=10,
+        generations=4,
+        reproduction=peal.operators.reproduction.Crossover(),
+        mutation=peal.operators.mutation.NormalDist(prob=0.5),
+        selection=peal.operators.selection.Tournament(),
+        init_populations=3,
+    )
+    fitness = peal.fitness(batched=True)(
+        lambda genes: -np.sum(genes**2, axis=1)
+    )
+
+    results = []
+    for _ in range(2):
+        peal.rng.seed(42)
+        tracker = peal.callback.BestWorst()
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            environment = peal.core.Environment(
+                peal.genetics.NumberPool(4, lower=-1, upper=1),
+                fitness,
+                executor=executor,
+            )
+            environment.execute(strategy, [tracker])
+        results.append(tracker.best.genes)
+
+    assert results[0].shape == (12, 4)
+    assert np.array_equal(results[0], results[1])
+
+
+def test_custom_operator_is_evaluated():
+    class Shift(peal.operators.operator.Operator):
+
+        def _process_population(
+            self,
+            container: peal.Population,
+        ) -> peal.Population:
+            ind = container[0].copy()
+            ind.genes[0] += 1000
+            return peal.Population(ind)
+
+    class ShiftAll(peal.operators.operator.Operator):
+
+        def _process_population(
+            self,
+            container: peal.Population,
+        ) -> peal.Population:
+            population = container.deepcopy()
+            for ind in population:
+                ind.genes[0] += 1000
+            return population
+
+    for mutation in (Shift(), ShiftAll()):
+        strategy = peal.core.Strategy(
+            init_individuals=5,
+            generations=3,
+            reproduction=peal.operators.reproduction.Copy(),
+            mutation=mutation,
+            selection=peal.operators.selection.Tournament(),
+        )
+        fitness = peal.fitness(lambda ind: float(ind.genes.sum()))
+        tracker = peal.callback.BestWorst()
+
+        peal.core.Environment(
+            peal.genetics.NumberPool(2, lower=0, upper=1),
+            fitness,
+        ).execute(strategy, [tracker])
+
+        assert np.allclose(
+            tracker.best.fitness,
+            tracker.best.genes.sum(axis=1),
+        )
+        assert np.all(tracker.best.fitness > 1000)
+
+
+def negative_norm(genes: np.ndarray) -> np.ndarray:
+    return -np.sum(genes**2, axis=1)
+
+
+def test_process_islands():
+    strategy = peal.core.Strategy(
+        init_individuals=10,
+        generations=4,
+        reproduction=peal.operators.reproduction.Crossover(),
+        mutation=peal.operators.mutation.NormalDist(prob=0.5),
+        selection=peal.operators.selection.Tournament(),
+        init_populations=2,
+        migration=peal.operators.clash.Migration(),
+        migration_interval=2,
+    )
+    tracker = peal.callback.BestWorst()
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        peal.core.Environment(
+            peal.genetics.NumberPool(4, lower=-1, upper=1),
+            peal.Fitness(negative_norm, batched=True, cache_size=8),
+            executor=executor,
+        ).execute(strategy, [tracker])
+
+    assert tracker.best.size == 8
+    assert np.allclose(
+        tracker.best.fitness,
+        negative_norm(tracker.best.genes),
+    )
+
+
+def test_overridden_mutation_is_not_fused():
+    class Clip(peal.operators.mutation.NormalDist):
+
+        def _process_population(
+            self,
+            container: peal.Population,
+        ) -> peal.Population:
+            mutated = super()._process_population(container)
+            return mutated.with_genes(np.clip(mutated.genes, 0, 1))
+
+    strategy = peal.core.Strategy(
+        init_individuals=6,
+        generations=3,
+        reproduction=peal.operators.reproduction.Crossover(),
+        mutation=Clip(prob=1.0, sigma=5.0),
+        selection=peal.operators.selection.Tournament(),
+    )
+    tracker = peal.callback.BestWorst()
+
+    peal.core.Environment(
+        peal.genetics.NumberPool(2, lower=0, upper=1),
+        peal.Fitness(negative_norm, batched=True),
+    ).execute(strategy, [tracker])
+
+    assert np.all((tracker.best.genes >= 0) & (tracker.best.genes <= 1))
+
+
+def test_evaluate_all():
+    class Clone(peal.operators.operator.Operator):
+
+        def _process_population(
+            self,
+            container: peal.Population,
+        ) -> peal.Population:
+            # the same individuals, which stay clean once evaluated
+            return container.copy()
+
+    calls = []
+
+    @peal.fitness(batched=True)
+    def count(genes: np.ndarray) -> np.ndarray:
+        calls.append(len(genes))
+        return np.zeros(len(genes))
+
+    strategy = peal.core.Strategy(
+        init_individuals=4,
+        generations=3,
+        reproduction=Clone(),
+        mutation=peal.operators.mutation.NormalDist(prob=0),
+        selection=peal.operators.selection.Best(8, 4),
+    )
+    pool = peal.genetics.NumberPool(2, lower=0, upper=1)
+
+    peal.core.Environment(pool, count).execute(strategy, [])
+    # only the initial population and the copy in the first generation
+    # are evaluated, the unchanged clones afterwards are skipped
+    assert calls == [4, 4]
+    calls.clear()
+    peal.core.Environment(pool, count, evaluate_all=True).execute(
+        strategy, [],
+    )
+    assert calls == [4, 4, 4, 4]
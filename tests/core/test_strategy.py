@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+
+import peal
+
+
+def test_from_string():
+    strategy = peal.core.Strategy.from_string("2/2+3(4/2,8)^5", 1)
+    assert strategy.init_populations == 2
+    assert strategy.init_individuals == 4
+    assert strategy.generations == 5
+    assert strategy.select_parent_populations
+
+    with pytest.raises(ValueError):
+        peal.core.Strategy.from_string("4,8^5", 1)
+
+
+def test_from_string_copies():
+    strategy = peal.core.Strategy.from_string("(4/1,8)", 1)
+    population = peal.Population.from_genes(np.arange(4).reshape(4, 1))
+
+    offspring = strategy.reproduction.process(population)
+
+    assert offspring.size == 8
+    assert set(offspring.genes[:, 0]) <= {0, 1, 2, 3}
@@ -0,0 +1,35 @@
+import numpy as np
+
+import peal
+
+
+def test_migration():
+    community = peal.community.Community()
+    for offset in (0, 10, 20):
+        population = peal.Population.from_genes(
+            np.arange(offset, offset+4).reshape(4, 1)
+        )
+        for ind in population:
+            ind.fitness = ind.genes[0]
+        community.integrate(population)
+
+    migrated = peal.operators.clash.Migration(size=2).process(community)
+
+    assert migrated.size == 3
+    assert sorted(migrated[0].genes[:, 0]) == [2, 3, 22, 23]
+    assert sorted(migrated[1].genes[:, 0]) == [2, 3, 12, 13]
+    assert sorted(migrated[2].genes[:, 0]) == [12, 13, 22, 23]
+    assert sorted(community[0].genes[:, 0]) == [0, 1, 2, 3]
+
+
+def test_equimix():
+    community = peal.community.Community([
+        peal.Population.from_genes(np.full((5, 1), k)) for k in range(3)
+    ])
+
+    mixed = peal.operators.clash.EquiMix(3, 4, group_size=2).process(
+        community
+    )
+
+    assert mixed.size == 4
+    assert all(population.size == 5 for population in mixed)
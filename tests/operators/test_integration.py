@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+import peal
+
+
+def test_crowded():
+    parents = peal.Population.from_genes(np.arange(8).reshape(4, 2))
+    offspring = peal.Population.from_genes(np.array([[0, 1], [6, 0]]))
+    crowded = peal.operators.integration.Crowded(crowding_factor=4)
+    crowded.rng = np.random.default_rng(0)
+
+    merged, = crowded.process(
+        peal.community.Community((offspring, parents))
+    )
+
+    assert np.array_equal(merged.genes, [[0, 1], [2, 3], [4, 5], [6, 0]])
+
+    with pytest.raises(ValueError):
+        peal.operators.integration.Crowded(crowding_factor=5).process(
+            peal.community.Community((offspring, parents))
+        )
+
+
+def test_crowded_large():
+    # candidates are drawn for each offspring separately if all
+    # permutations at once would be too large
+    parents = peal.Population.from_genes(np.zeros((2048, 2)))
+    offspring = peal.Population.from_genes(np.ones((1024, 2)))
+    crowded = peal.operators.integration.Crowded(crowding_factor=3)
+
+    merged, = crowded.process(
+        peal.community.Community((offspring, parents))
+    )
+
+    assert merged.size == 2048
+    assert 0 < merged.genes[:, 0].sum() <= 1024
+
+
+def test_crowded_matrix_genomes():
+    parents = peal.Population.from_genes(np.arange(24).reshape(4, 2, 3))
+    offspring = peal.Population.from_genes(
+        np.array([[[6, 7, 8], [0, 0, 0]]])
+    )
+    crowded = peal.operators.integration.Crowded(crowding_factor=4)
+
+    merged, = crowded.process(
+        peal.community.Community((offspring, parents))
+    )
+
+    assert np.array_equal(merged[1].genes, offspring[0].genes)
+    assert np.array_equal(merged[0].genes, parents[0].genes)
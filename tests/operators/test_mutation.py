@@ -0,0 +1,57 @@
+import numpy as np
+
+import peal
+
+
+def test_vectorized_mutations():
+    population = peal.Population.from_genes(np.zeros((5, 4), dtype=int))
+
+    flipped = peal.operators.mutation.BitFlip(prob=1.0).process(population)
+    assert np.array_equal(flipped.genes, np.ones((5, 4)))
+    assert np.array_equal(population.genes, np.zeros((5, 4)))
+
+    mutated = peal.operators.mutation.UniformFloat(
+        prob=1.0,
+        lowest=2.0,
+        highest=3.0,
+    ).process(peal.Population.from_genes(np.zeros((5, 4))))
+    assert np.all((2 <= mutated.genes) & (mutated.genes <= 3))
+
+    mutated = peal.operators.mutation.NormalDist(
+        prob=1.0,
+        alpha=2.0,
+    ).process(peal.Population.from_genes(np.zeros((5, 4))))
+    assert np.all(mutated.genes != 0)
+    for ind in mutated:
+        assert ind.hidden_genes[0] in (0.5, 2.0)
+
+
+def test_operator_rng():
+    population = peal.Population.from_genes(np.zeros((5, 4)))
+    mutation = peal.operators.mutation.UniformFloat(prob=0.5)
+
+    mutation.rng = np.random.default_rng(42)
+    first = mutation.process(population).genes
+    mutation.rng = np.random.default_rng(42)
+    assert np.array_equal(mutation.process(population).genes, first)
+
+    mutation.rng = None
+    assert mutation.rng is peal.rng.get_generator()
+
+
+def test_mutate_crossed_genes():
+    population = peal.Population.from_genes(np.arange(40).reshape(10, 4))
+    crossover = peal.operators.reproduction.Crossover(probability=1.0)
+    mutation = peal.operators.mutation.UniformInt(lowest=-9, highest=-1)
+
+    crossover.rng = np.random.default_rng(1)
+    mutation.rng = np.random.default_rng(2)
+    expected = mutation.process(crossover.process(population))
+
+    crossover.rng = np.random.default_rng(1)
+    mutation.rng = np.random.default_rng(2)
+    parents, genes = crossover.cross(population)
+    offspring = mutation.mutate(parents, genes)
+
+    assert np.array_equal(offspring.genes, expected.genes)
+    assert np.array_equal(population.genes, np.arange(40).reshape(10, 4))
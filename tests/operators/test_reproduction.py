@@ -0,0 +1,21 @@
+import numpy as np
+
+import peal
+
+
+def test_discrete_recombination():
+    population = peal.Population.from_genes(
+        np.repeat(np.arange(1, 4)[:, np.newaxis], 8, axis=1)
+    )
+    recombination = peal.operators.reproduction.DiscreteRecombination(
+        in_size=3,
+        probability=1.0,
+    )
+
+    offspring = recombination.process(population)
+
+    assert offspring.size == 1
+    assert np.array_equal(
+        np.bincount(offspring[0].genes, minlength=4),
+        [0, 3, 3, 2],
+    )
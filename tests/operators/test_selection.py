@@ -0,0 +1,56 @@
+import numpy as np
+
+import peal
+
+
+def test_tournament():
+    population = peal.Population.from_genes(np.arange(20).reshape(10, 2))
+    for ind, fitness in zip(population, [3, 1, 4, 1, 5, 9, 2, 6, 5, 3]):
+        ind.fitness = fitness
+
+    for size in (2, 3):
+        tournament = peal.operators.selection.Tournament(size=size)
+        tournament.rng = np.random.default_rng(7)
+        selected = tournament.process(population)
+
+        # the first participant with the highest fitness wins
+        participants = np.random.default_rng(7).integers(
+            0, 10, size=(10, size), dtype=np.intp,
+        )
+        expected = []
+        for row in participants:
+            winner = row[0]
+            for i in row[1:]:
+                if population[i].fitness > population[winner].fitness:
+                    winner = i
+            expected.append(population[winner].genes)
+
+        assert np.array_equal(selected.genes, expected)
+
+
+def test_best():
+    population = peal.Population.from_genes(np.arange(12).reshape(6, 2))
+    for ind, fitness in zip(population, [1, 3, 2, 3, 1, 0]):
+        ind.fitness = fitness
+
+    best = peal.operators.selection.Best(in_size=6, out_size=3)
+    selected = best.process(population)
+
+    # individuals of equal fitness stay in order
+    assert np.array_equal(selected.fitness, [3, 3, 2])
+    assert np.array_equal(selected.genes, [[2, 3], [6, 7], [4, 5]])
+
+
+def test_best_mean():
+    community = peal.community.Community(tuple(
+        peal.Population.from_genes(np.full((2, 1), i)) for i in range(4)
+    ))
+    for population, fitness in zip(community, [1, 2, 1, 2]):
+        for ind in population:
+            ind.fitness = fitness
+
+    best = peal.operators.selection.BestMean(in_size=4, out_size=3)
+    selected = best.process(community)
+
+    assert selected.size == 3
+    assert [population[0].genes[0] for population in selected] == [1, 3, 0]
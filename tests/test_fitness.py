@@ -0,0 +1,218 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import pickle
+
+import numpy as np
+
+import peal
+
+
+def test_batched_fitness():
+    A = np.array([1, 2, 3])
+
+    @peal.fitness
+    def single(individual: peal.Individual) -> float:
+        return -np.mean((A - individual.genes)**2)
+
+    @peal.fitness(batched=True)
+    def batched(genes: np.ndarray) -> np.ndarray:
+        return -np.mean((A - genes)**2, axis=1)
+
+    assert batched.batched and not single.batched
+
+    population = peal.Population([
+        peal.Individual(np.array([1, 2, 3])),
+        peal.Individual(np.array([0, 0, 0])),
+        peal.Individual(np.array([4, 2, 1])),
+    ])
+    single.evaluate(population)
+    expected = population.fitness
+    for ind in population:
+        ind.fitness = 0.0
+    batched.evaluate(population)
+
+    assert np.allclose(population.fitness, expected)
+
+    individual = peal.Individual(np.array([0, 2, 3]))
+    batched.evaluate(individual)
+    assert np.isclose(individual.fitness, -1/3)
+
+
+def test_executor_fitness():
+    def total(individual: peal.Individual) -> float:
+        return float(individual.genes.sum())
+
+    population = peal.Population.from_genes(np.arange(20).reshape(10, 2))
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        parallel = peal.Fitness(total, executor=executor)
+        parallel.evaluate(population)
+
+    assert np.array_equal(population.fitness, np.arange(1, 39, 4))
+
+    for ind in population:
+        ind.fitness = 0.0
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        batched = peal.Fitness(
+            lambda genes: genes.sum(axis=1),
+            batched=True,
+            executor=executor,
+        )
+        batched.evaluate(population)
+
+    assert np.array_equal(population.fitness, np.arange(1, 39, 4))
+
+
+def test_fitness_cache():
+    calls = []
+
+    @peal.fitness(batched=True, cache_size=2)
+    def total(genes: np.ndarray) -> np.ndarray:
+        calls.append(genes.shape[0])
+        return genes.sum(axis=1)
+
+    total.evaluate(peal.Population.from_genes(
+        np.array([[1, 2], [3, 4], [1, 2]])
+    ))
+    total.evaluate(peal.Population.from_genes(np.array([[3, 4], [5, 6]])))
+    population = peal.Population.from_genes(np.array([[1, 2], [5, 6]]))
+    total.evaluate(population)
+
+    assert calls == [3, 1, 1]
+    assert np.array_equal(population.fitness, [3, 11])
+
+
+def test_fitness_cache_keys():
+    fitness = peal.Fitness(lambda ind: float(ind.genes.size), cache_size=4)
+    # both genomes consist of the same bytes
+    small = peal.Individual(np.array([1, 0], dtype=np.int32))
+    large = peal.Individual(np.array([1], dtype=np.int64))
+    fitness.evaluate(small)
+    fitness.evaluate(large)
+
+    assert (small.fitness, large.fitness) == (2, 1)
+
+
+def test_negative_mse():
+    A = np.array([4, 74, 43, 23, 0])
+    B = np.array([1, 0, 2, 9, 3])
+    population = peal.Population.from_genes(
+        np.random.randint(0, 101, size=(20, 5))
+    )
+    genes = population.genes
+
+    peal.evaluation.negative_mse(A).evaluate(population)
+    assert np.allclose(population.fitness, -np.mean((A - genes)**2, axis=1))
+
+    peal.evaluation.negative_mse(A, B).evaluate(population)
+    assert np.allclose(
+        population.fitness,
+        -np.mean((A - genes)**2, axis=1) - np.mean((B - genes)**2, axis=1),
+    )
+
+
+def test_negative_mse_large_values():
+    A = np.full(3, 1e8)
+    B = np.full(3, 1e8 + 1)
+    genes = np.array([[1e8, 1e8, 1e8], [1e8 + 3, 1e8 - 2, 1e8 + 1]])
+    population = peal.Population.from_genes(genes)
+
+    peal.evaluation.negative_mse(A, B).evaluate(population)
+    assert np.allclose(
+        population.fitness,
+        -np.mean((A - genes)**2, axis=1) - np.mean((B - genes)**2, axis=1),
+    )
+
+
+def test_batched_community():
+    calls = []
+
+    @peal.fitness(batched=True)
+    def evaluate(genes: np.ndarray) -> np.ndarray:
+        calls.append(len(genes))
+        return genes.sum(axis=1)
+
+    community = peal.community.Community((
+        peal.Population.from_genes(np.ones((2, 3))),
+        peal.Population.from_genes(np.zeros((3, 3))),
+    ))
+    evaluate(community)
+
+    assert calls == [5]
+    assert np.array_equal(community[0].fitness, [3, 3])
+    assert np.array_equal(community[1].fitness, [0, 0, 0])
+
+
+def total(individual: peal.Individual) -> float:
+    return float(individual.genes.sum())
+
+
+def test_pickle_fitness():
+    fitness = peal.Fitness(total, cache_size=2)
+    fitness.evaluate(peal.Individual(np.array([1, 2])))
+
+    restored = pickle.loads(pickle.dumps(fitness))
+    individual = peal.Individual(np.array([3, 4]))
+    restored.evaluate(individual)
+
+    assert individual.fitness == 7
+
+
+def add(x: float, y: float) -> float:
+    return x + y
+
+
+def mean(values: list[float]) -> float:
+    return float(np.mean(values))
+
+
+def test_gp_fitness_processes():
+    # add(x, 2) as a GP tree in breadth-first order
+    individual = peal.Individual(np.array([
+        peal.genetics.GPCallable(float, "add", {"x": float, "y": float}, add),
+        peal.genetics.GPTerminal(float, "x"),
+        peal.genetics.GPTerminal(float, "2", 2.0),
+    ]))
+    arguments = [{"x": 1.0}, {"x": 3.0}]
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        for vectorized in (False, True):
+            individual.fitness = 0.0
+            peal.GPFitness(
+                arguments,
+                evaluation=mean,
+                executor=executor,
+                vectorized=vectorized,
+            ).evaluate(individual)
+            assert individual.fitness == 4.0
+
+
+def sub(x: float, y: float) -> float:
+    return x - y
+
+
+def mul(x: float, y: float) -> float:
+    return x * y
+
+
+def test_gp_evaluate_batch():
+    # sub(mul(x, y), 3) as a GP tree in breadth-first order
+    signature = {"x": float, "y": float}
+    individual = peal.Individual(np.array([
+        peal.genetics.GPCallable(float, "sub", signature, sub),
+        peal.genetics.GPCallable(float, "mul", signature, mul),
+        peal.genetics.GPTerminal(float, "3", 3.0),
+        peal.genetics.GPTerminal(float, "x"),
+        peal.genetics.GPTerminal(float, "y"),
+    ]))
+    arguments = [
+        {"x": 1.0, "y": 2.0},
+        {"x": -3.0, "y": 0.5},
+        {"x": 4.0, "y": 4.0},
+    ]
+
+    single = [
+        peal.evaluation.gp_evaluate(individual, argset)
+        for argset in arguments
+    ]
+    batch = peal.evaluation.gp_evaluate_batch(individual, arguments)
+
+    assert single == [-1.0, -4.5, 13.0]
+    assert np.array_equal(batch, single)
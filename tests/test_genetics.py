@@ -0,0 +1,23 @@
+import numpy as np
+
+import peal
+
+
+def test_random_genomes():
+    pool = peal.genetics.IntegerPool(shape=5, lower=2, upper=4, dtype=np.uint8)
+    genes = pool.random_genomes(10)
+    assert genes.shape == (10, 5)
+    assert genes.dtype == np.uint8
+    assert np.all((2 <= genes) & (genes <= 4))
+
+    pool = peal.genetics.NumberPool(shape=3, lower=-1, upper=1)
+    genes = pool.random_genomes(4)
+    assert genes.shape == (4, 3)
+    assert np.all((-1 <= genes) & (genes <= 1))
+
+
+def test_integer_pool_dtype():
+    assert peal.genetics.IntegerPool(3, 0, 1).dtype == np.int64
+    assert peal.genetics.IntegerPool(3, 0, 101, None).dtype == np.uint8
+    assert peal.genetics.IntegerPool(3, -1, 1, None).dtype == np.int8
+    assert peal.genetics.IntegerPool(3, -5, 70000, None).dtype == np.int32
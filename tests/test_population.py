@@ -0,0 +1,68 @@
+import numpy as np
+
+import peal
+
+
+def test_from_genes():
+    genes = np.arange(12).reshape(4, 3)
+    population = peal.Population.from_genes(genes)
+
+    assert population.size == 4
+    assert np.array_equal(population.genes, genes)
+    assert np.shares_memory(population[0].genes, population[3].genes.base)
+
+    for i, ind in enumerate(population):
+        ind.fitness = i
+    assert isinstance(population.fitness, np.ndarray)
+    assert np.array_equal(population.fitness, [0, 1, 2, 3])
+    assert np.array_equal(population[np.array([3, 1])].fitness, [3, 1])
+    mask = population.fitness > 1
+    assert np.array_equal(population[mask].fitness, [2, 3])
+
+
+def test_genes_block():
+    population = peal.Population.from_genes(np.zeros((3, 2)))
+    genes = population.genes
+    genes[0, 0] = 1
+    assert population[0].genes[0] == 0
+
+    population[1].genes = np.ones(2)
+    assert np.array_equal(population.genes, [[0, 0], [1, 1], [0, 0]])
+
+
+def test_with_genes():
+    population = peal.Population.from_genes(np.zeros((3, 2)))
+    population[0].fitness = 1.0
+    population[0].hidden_genes[0] = 2.0
+
+    new = population.with_genes(np.ones((3, 2)))
+    assert np.array_equal(new.fitness, [1, 0, 0])
+    assert new[0].hidden_genes[0] == 2.0
+    new[1].hidden_genes[0] = 3.0
+    assert population[1].hidden_genes[0] == 1.0
+    assert new[2].hidden_genes[0] == 1.0
+
+
+def test_iteration():
+    population = peal.Population.from_genes(np.arange(3).reshape(3, 1))
+    pairs = [(a.genes[0], b.genes[0]) for a in population for b in population]
+    assert len(pairs) == 9
+    assert len(population) == 3
+    assert len(peal.community.Community((population, population))) == 2
+
+
+def test_dirty():
+    population = peal.Population.from_genes(np.zeros((3, 2)))
+    assert all(ind.dirty for ind in population)
+
+    peal.Fitness(lambda genes: genes.sum(axis=1), batched=True)(population)
+    assert not any(ind.dirty for ind in population)
+    copied = population.deepcopy()
+    assert all(ind.dirty for ind in copied)
+    copied[0].genes[0] = 5.0
+    assert population[0].genes[0] == 0.0
+
+    genes = population.genes
+    genes[1, 0] = 1
+    new = population.with_genes(genes)
+    assert [ind.dirty for ind in new] == [False, True, False]